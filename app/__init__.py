@@ -5,14 +5,15 @@ import os
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
-from flask_migrate import Migrate
-from flask_cors import CORS
+from sqlalchemy.orm import configure_mappers
 from app.config import config
+from app.utils.caching import cache
+from app.utils.database import RoutingSession
 
-# Initialize extensions
-db = SQLAlchemy()
+# Initialize extensions (models need db and the services need cache at
+# import time; the other extensions are imported inside create_app)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 ma = Marshmallow()
-migrate = Migrate()
 
 
 def create_app(config_name='development'):
@@ -36,24 +37,50 @@ def create_app(config_name='development'):
     # Load configuration
     app.config.from_object(config[config_name])
     
+    # Encode jsonify/dict responses and decode request bodies with orjson
+    from app.utils.responses import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    
+    # Split SQLite reads and writes into separate pools (file databases only)
+    from app.utils.database import configure_read_write_split
+    configure_read_write_split(app)
+    
     # Initialize extensions with app
+    from flask_migrate import Migrate
+    from flask_cors import CORS
+    from flask_compress import Compress
+    
     db.init_app(app)
     ma.init_app(app)
-    migrate.init_app(app, db)
+    Migrate(app, db)
     CORS(app)
+    Compress(app)
+    cache.init_app(app)
+    
+    # Tune SQLite connections (no-op for other backends)
+    from app.utils.database import register_sqlite_pragmas
+    register_sqlite_pragmas(app)
     
     # Import models (must be after db initialization)
     from app.models import Employee, Task
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-        print("✅ Database tables created successfully!")
+    # Build relationships now: the Task.assigned_employee backref only
+    # exists as a class attribute once the mappers are configured, and the
+    # task queries use it before any instance has been loaded
+    configure_mappers()
+    
+    # Create missing database tables (until migrations manage the schema)
+    if app.config.get('AUTO_CREATE_TABLES', app.config.get('TESTING')):
+        from app.utils.database import create_tables
+        with app.app_context():
+            create_tables(db)
+            print("✅ Database tables created successfully!")
     
     # Register blueprints
-    from app.routes import employee_routes, task_routes
+    from app.routes import batch_routes, employee_routes, task_routes
     app.register_blueprint(employee_routes.bp)
     app.register_blueprint(task_routes.bp)
+    app.register_blueprint(batch_routes.bp)
     
     # Register error handlers
     from app.utils import error_handlers
@@ -69,7 +96,8 @@ def create_app(config_name='development'):
             'version': '1.0.0',
             'endpoints': {
                 'employees': '/api/employees',
-                'tasks': '/api/tasks'
+                'tasks': '/api/tasks',
+                'batch': '/api/batch'
             }
         }, 200
     
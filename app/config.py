@@ -3,6 +3,63 @@ Application configuration classes for different environments.
 """
 import os
 from datetime import timedelta
+from sqlalchemy.pool import QueuePool, StaticPool
+
+
+def database_url(default=None):
+    """
+    Read DATABASE_URL, pointing bare Postgres URLs at the psycopg 3 driver.
+    
+    Hosting platforms hand out postgres:// or postgresql:// URLs, which
+    SQLAlchemy would map to psycopg2 (not installed).
+    
+    Args:
+        default (str): URL to use when DATABASE_URL is unset
+        
+    Returns:
+        str or None: Database URL
+    """
+    url = os.getenv('DATABASE_URL', default)
+    if url:
+        for prefix in ('postgres://', 'postgresql://'):
+            if url.startswith(prefix):
+                return 'postgresql+psycopg://' + url[len(prefix):]
+    return url
+
+
+def _prepare_threshold():
+    """
+    Read psycopg's prepare_threshold from DB_PREPARE_THRESHOLD.
+    
+    'none' disables prepared statements, which transaction-pooling
+    PgBouncer setups require.
+    
+    Returns:
+        int or None: Executions before a statement is prepared
+    """
+    value = os.getenv('DB_PREPARE_THRESHOLD', '5')
+    return None if value.lower() == 'none' else int(value)
+
+
+def _pool_limits():
+    """
+    Split the database connection budget across the web workers.
+    
+    Every worker process has its own pool, so the server can see up to
+    workers * (pool_size + max_overflow) connections. DB_MAX_CONNECTIONS
+    (default 80, under the ~100 of managed Postgres plans, leaving room for
+    migrations and shells) is divided by WEB_CONCURRENCY, which
+    gunicorn.conf.py exports; half of each share is kept open.
+    DB_POOL_SIZE and DB_MAX_OVERFLOW override the derived values.
+    
+    Returns:
+        dict: pool_size and max_overflow engine options for one worker
+    """
+    workers = max(int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1)), 1)
+    per_worker = max(int(os.getenv('DB_MAX_CONNECTIONS', 80)) // workers, 2)
+    pool_size = int(os.getenv('DB_POOL_SIZE', per_worker // 2))
+    max_overflow = int(os.getenv('DB_MAX_OVERFLOW', max(per_worker - pool_size, 0)))
+    return {'pool_size': pool_size, 'max_overflow': max_overflow}
 
 
 class Config:
@@ -15,23 +72,65 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-fallback')
     
     # Database - Use absolute path for SQLite
-    SQLALCHEMY_DATABASE_URI = os.getenv(
-        'DATABASE_URL', 
+    SQLALCHEMY_DATABASE_URI = database_url(
         f"sqlite:///{os.path.join(BASE_DIR, 'instance', 'app.db')}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
     
+    # Keep connections open between requests instead of reopening the database
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': QueuePool,
+        'pool_size': 10,
+        'pool_pre_ping': True,
+        'pool_recycle': 3600
+    }
+    
+    # SQLite connection tuning: WAL lets readers run alongside the writer,
+    # NORMAL sync is safe under WAL, and a 20 MB page cache keeps hot pages in memory
+    SQLITE_PRAGMAS = (
+        'journal_mode=WAL',
+        'busy_timeout=5000',
+        'synchronous=NORMAL',
+        'cache_size=-20000',
+        'temp_store=memory',
+        'foreign_keys=ON'
+    )
+    
+    # Serve GET requests from a read-only pool and writes from a single
+    # BEGIN IMMEDIATE connection (file-backed SQLite only)
+    SQLITE_SPLIT_READ_WRITE = True
+    
     # JSON settings
     JSON_SORT_KEYS = False
-    JSONIFY_PRETTYPRINT_REGULAR = True
+    
+    # Response compression (gzip/br) for JSON bodies worth compressing
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_LEVEL = 4
+    COMPRESS_MIN_SIZE = 1024
+    
+    # List response cache (use RedisCache with several workers so a write
+    # on one worker invalidates the pages cached by the others)
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'SimpleCache')
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 60))
+    
+    # Seconds clients may reuse a GET response before revalidating its ETag
+    HTTP_CACHE_MAX_AGE = int(os.getenv('HTTP_CACHE_MAX_AGE', 30))
     
     # Upload limits
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))
     
+    # Schema creation on boot (missing tables only; run `flask db upgrade`
+    # where this is off)
+    AUTO_CREATE_TABLES = os.getenv('AUTO_CREATE_TABLES', 'False').lower() == 'true'
+    
     # Pagination defaults
     DEFAULT_PAGE_SIZE = 10
     MAX_PAGE_SIZE = 100
+    
+    # Sub-requests accepted by one POST /api/batch call
+    BATCH_MAX_REQUESTS = int(os.getenv('BATCH_MAX_REQUESTS', 50))
 
 
 class DevelopmentConfig(Config):
@@ -40,6 +139,7 @@ class DevelopmentConfig(Config):
     DEBUG = True
     TESTING = False
     SQLALCHEMY_ECHO = True
+    AUTO_CREATE_TABLES = True
 
 
 class ProductionConfig(Config):
@@ -49,7 +149,35 @@ class ProductionConfig(Config):
     TESTING = False
     
     # Production database (PostgreSQL from Render/Railway)
-    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
+    SQLALCHEMY_DATABASE_URI = database_url()
+    
+    # The repo has no migrations/ yet, so a fresh deploy creates its tables
+    # on boot; set AUTO_CREATE_TABLES=false once `flask db upgrade` manages them
+    AUTO_CREATE_TABLES = os.getenv('AUTO_CREATE_TABLES', 'True').lower() == 'true'
+    
+    # Pool sized from the connection budget shared by all workers; recycle
+    # before managed Postgres/proxies drop idle connections
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        **_pool_limits(),
+        'pool_recycle': 300
+    }
+    
+    # psycopg 3 turns statements run prepare_threshold times on a connection
+    # into server-side prepared statements, skipping parse/plan on reuse
+    if (SQLALCHEMY_DATABASE_URI or '').startswith('postgresql+psycopg://'):
+        SQLALCHEMY_ENGINE_OPTIONS['connect_args'] = {
+            'prepare_threshold': _prepare_threshold()
+        }
+    
+    # Share the list cache between workers through Redis when it is configured.
+    # Without Redis caching is off on purpose: a per-worker SimpleCache would
+    # keep serving pages that a write on another worker has made stale
+    CACHE_TYPE = os.getenv(
+        'CACHE_TYPE',
+        'RedisCache' if os.getenv('CACHE_REDIS_URL') else 'NullCache'
+    )
+    CACHE_NO_NULL_WARNING = True
     
     # Force HTTPS in production
     PREFERRED_URL_SCHEME = 'https'
@@ -60,10 +188,18 @@ class TestingConfig(Config):
     
     TESTING = True
     DEBUG = True
+    AUTO_CREATE_TABLES = True
     
     # Use in-memory SQLite for tests
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     
+    # In-memory SQLite lives on a single connection shared by every session;
+    # the test fixtures roll each test back on it, so pin it explicitly
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
+    
     # Disable CSRF for testing
     WTF_CSRF_ENABLED = False
 
@@ -1,8 +1,9 @@
 """
 Employee model representing employees in the system.
 """
-from datetime import datetime, date, timezone
+from datetime import datetime, date
 from app import db
+from app.utils.database import utcnow
 
 
 class Employee(db.Model):
@@ -10,6 +11,15 @@ class Employee(db.Model):
     
     __tablename__ = 'employees'
     
+    # (created_at, id) so the newest-first list and its cursor seek read in
+    # index order
+    __table_args__ = (
+        db.Index('ix_emp_created_id', 'created_at', 'id'),
+    )
+    
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
+    
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
     
@@ -24,24 +34,26 @@ class Employee(db.Model):
     position = db.Column(db.String(100), nullable=True)
     hire_date = db.Column(db.Date, nullable=True)
     
-    # Timestamps
-
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    # Timestamps (computed by the database; eager_defaults reads them back)
+    created_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
-    tasks = db.relationship('Task', backref='assigned_employee', lazy='dynamic', cascade='all, delete-orphan')
+    tasks = db.relationship('Task', backref='assigned_employee', lazy='selectin', cascade='all, delete-orphan')
     
     def __repr__(self):
         """String representation of Employee."""
         return f'<Employee {self.first_name} {self.last_name}>'
     
-    def to_dict(self, include_tasks=False):
+    def to_dict(self, include_tasks=False, tasks=None):
         """
         Convert employee object to dictionary for JSON serialization.
+        Dates are left as date/datetime objects for orjson to encode.
         
         Args:
             include_tasks (bool): Whether to include associated tasks
+            tasks (list): Already-loaded tasks to serialize instead of
+                reading the relationship (implies include_tasks)
             
         Returns:
             dict: Employee data as dictionary
@@ -54,13 +66,14 @@ class Employee(db.Model):
             'phone': self.phone,
             'department': self.department,
             'position': self.position,
-            'hire_date': self.hire_date.isoformat() if self.hire_date else None,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'hire_date': self.hire_date,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
         
-        if include_tasks:
-            data['tasks'] = [task.to_dict() for task in self.tasks]
+        if tasks is not None or include_tasks:
+            tasks = tasks if tasks is not None else self.tasks
+            data['tasks'] = [task.to_dict() for task in tasks]
         
         return data
     
@@ -1,8 +1,9 @@
 """
 Task model representing tasks assigned to employees.
 """
-from datetime import datetime, date, timezone
+from datetime import datetime, date
 from app import db
+from app.utils.database import utcnow
 
 
 class Task(db.Model):
@@ -10,6 +11,20 @@ class Task(db.Model):
     
     __tablename__ = 'tasks'
     
+    # The (filter, created_at) indexes serve each filter with the newest-first
+    # ordering as an index range scan instead of a sort; their leading
+    # columns also cover plain status/priority/employee_id lookups (e.g. an
+    # employee's tasks and the ON DELETE SET NULL foreign key)
+    __table_args__ = (
+        db.Index('ix_task_created_id', 'created_at', 'id'),
+        db.Index('ix_task_status_created', 'status', 'created_at'),
+        db.Index('ix_task_priority_created', 'priority', 'created_at'),
+        db.Index('ix_task_employee_created', 'employee_id', 'created_at'),
+    )
+    
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
+    
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
     
@@ -21,35 +36,31 @@ class Task(db.Model):
     status = db.Column(
         db.String(20), 
         nullable=False, 
-        default='pending',
-        index=True
+        default='pending'
     )
     priority = db.Column(
         db.String(20), 
         nullable=False, 
-        default='medium',
-        index=True
+        default='medium'
     )
     
     # Assignment
     employee_id = db.Column(
         db.Integer, 
         db.ForeignKey('employees.id', ondelete='SET NULL'),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     # Deadlines
     deadline = db.Column(db.Date, nullable=True)
     
-    # Timestamps
-
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    # Timestamps (computed by the database; eager_defaults reads them back)
+    created_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
-    # Valid choices for status and priority
-    VALID_STATUSES = ['pending', 'in_progress', 'completed', 'cancelled']
-    VALID_PRIORITIES = ['low', 'medium', 'high', 'urgent']
+    # Valid choices for status and priority (frozensets for O(1) membership checks)
+    VALID_STATUSES = frozenset({'pending', 'in_progress', 'completed', 'cancelled'})
+    VALID_PRIORITIES = frozenset({'low', 'medium', 'high', 'urgent'})
     
     def __repr__(self):
         """String representation of Task."""
@@ -58,6 +69,7 @@ class Task(db.Model):
     def to_dict(self, include_employee=False):
         """
         Convert task object to dictionary for JSON serialization.
+        Dates are left as date/datetime objects for orjson to encode.
         
         Args:
             include_employee (bool): Whether to include assigned employee details
@@ -72,9 +84,9 @@ class Task(db.Model):
             'status': self.status,
             'priority': self.priority,
             'employee_id': self.employee_id,
-            'deadline': self.deadline.isoformat() if self.deadline else None,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'deadline': self.deadline,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
         
         if include_employee and self.assigned_employee:
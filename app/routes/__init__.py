@@ -1,6 +1,6 @@
 """
 Routes package initialization.
 """
-from app.routes import employee_routes, task_routes
+from app.routes import batch_routes, employee_routes, task_routes
 
-__all__ = ['employee_routes', 'task_routes']
+__all__ = ['batch_routes', 'employee_routes', 'task_routes']
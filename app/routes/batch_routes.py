@@ -0,0 +1,111 @@
+"""
+Batch API route bundling several API calls into one round trip.
+"""
+from urllib.parse import unquote, urlsplit
+import orjson
+from flask import Blueprint, current_app, request
+from werkzeug.exceptions import HTTPException
+from app.utils.responses import json_response, safe_json
+
+# Create blueprint
+bp = Blueprint('batch', __name__, url_prefix='/api/batch')
+
+BATCH_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+
+# WSGI environ key marking requests dispatched from inside a batch
+SUB_REQUEST_KEY = 'employee_task_api.batch'
+
+
+def _invalid_sub_request(index, item):
+    """Return an error message for a malformed sub-request, or None."""
+    if not isinstance(item, dict):
+        return f'Request {index} must be an object'
+    
+    method = str(item.get('method', 'GET')).upper()
+    if method not in BATCH_METHODS:
+        return f'Request {index} has an unsupported method'
+    
+    path = item.get('path')
+    if not isinstance(path, str) or not path.startswith('/api/'):
+        return f'Request {index} must have a path under /api/'
+    
+    # Resolve the route the way dispatch will (fragment dropped, percent
+    # escapes decoded) so spellings like /api/%62atch are caught too
+    try:
+        endpoint, _ = current_app.url_map.bind('').match(unquote(urlsplit(path).path), method)
+    except HTTPException:
+        # Unknown routes simply come back as 404/405 results
+        return None
+    
+    if endpoint == 'batch.run_batch':
+        return f'Request {index} cannot be a nested batch'
+    
+    return None
+
+
+@bp.route('', methods=['POST'])
+@safe_json('Error processing batch')
+def run_batch():
+    """
+    Run several API requests in one call.
+    
+    Sub-requests are dispatched through the application in order and one
+    failing does not stop the rest.
+    
+    Request Body:
+        JSON array of {method, path, body} objects; path may carry a query string
+    
+    Returns:
+        JSON response with a {status, body} result per sub-request, in order
+    """
+    # Backstop for the route check below: never fan out from a sub-request
+    if request.environ.get(SUB_REQUEST_KEY):
+        return json_response({
+            'status': 'error',
+            'message': 'Batches cannot be nested'
+        }, 400)
+    
+    items = request.json
+    
+    if not isinstance(items, list) or not items:
+        return json_response({
+            'status': 'error',
+            'message': 'Request body must be a non-empty JSON array'
+        }, 400)
+    
+    max_requests = current_app.config.get('BATCH_MAX_REQUESTS', 50)
+    if len(items) > max_requests:
+        return json_response({
+            'status': 'error',
+            'message': f'A batch can contain at most {max_requests} requests'
+        }, 400)
+    
+    for index, item in enumerate(items):
+        error = _invalid_sub_request(index, item)
+        if error:
+            return json_response({
+                'status': 'error',
+                'message': error
+            }, 400)
+    
+    client = current_app.test_client()
+    results = []
+    for item in items:
+        response = client.open(
+            item['path'],
+            method=str(item.get('method', 'GET')).upper(),
+            json=item.get('body'),
+            environ_base={SUB_REQUEST_KEY: True}
+        )
+        body = response.get_data()
+        
+        # Sub-responses are already JSON; embed them without re-parsing
+        results.append({
+            'status': response.status_code,
+            'body': orjson.Fragment(body) if body and response.is_json else None
+        })
+    
+    return json_response({
+        'status': 'success',
+        'data': results
+    }, 200)
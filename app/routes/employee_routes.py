@@ -1,20 +1,25 @@
 """
 Employee API routes for CRUD operations.
 """
-from flask import Blueprint, request, jsonify
-from marshmallow import ValidationError
-from app.services.employee_service import EmployeeService
-from app.schemas.employee_schema import (
-    employee_schema,
-    employees_schema,
-    employee_update_schema
+from flask import Blueprint, request
+from app.utils.responses import (
+    cache_headers,
+    json_response,
+    not_modified,
+    raw_json_response,
+    resource_etag,
+    safe_json
 )
+from app.utils.pagination import decode_cursor
+from app.services.employee_service import EmployeeService
+from app.schemas.employee_schema import employee_schema, employees_schema, employee_update_schema
 
 # Create blueprint
 bp = Blueprint('employees', __name__, url_prefix='/api/employees')
 
 
 @bp.route('', methods=['GET'])
+@safe_json('Error retrieving employees')
 def get_employees():
     """
     Get all employees with pagination and filtering.
@@ -22,91 +27,98 @@ def get_employees():
     Query Parameters:
         page (int): Page number (default: 1)
         per_page (int): Items per page (default: 10)
+        after_id (int): Return items after this ID (keyset pagination, no totals)
+        cursor (str): next_cursor from a previous page (newest-first seek, no totals)
+        with_total (int): Pass 1 to include total and pages in pagination info
         department (str): Filter by department
         position (str): Filter by position
     
+    Responses carry a weak ETag; a matching If-None-Match returns 304.
+    
     Returns:
         JSON response with employees list and pagination info
     """
-    try:
-        # Get query parameters
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 10, type=int)
-        department = request.args.get('department', None, type=str)
-        position = request.args.get('position', None, type=str)
-        
-        # Validate pagination parameters
-        if page < 1:
-            page = 1
-        if per_page < 1 or per_page > 100:
-            per_page = 10
-        
-        # Get employees from service
-        employees, pagination_info = EmployeeService.get_all_employees(
-            page=page,
-            per_page=per_page,
-            department=department,
-            position=position
-        )
-        
-        # Serialize employees manually to avoid tasks serialization issue
-        result = []
-        for employee in employees:
-            emp_dict = employee_schema.dump(employee)
-            # Get tasks as list instead of using the dynamic relationship
-            emp_dict['tasks'] = [task.to_dict() for task in employee.tasks.all()]
-            result.append(emp_dict)
-        
-        return jsonify({
-            'status': 'success',
-            'data': result,
-            'pagination': pagination_info
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': f'Error retrieving employees: {str(e)}'
-        }), 500
+    # Get query parameters
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 10, type=int)
+    after_id = request.args.get('after_id', None, type=int)
+    cursor = request.args.get('cursor', None, type=str)
+    with_total = request.args.get('with_total') == '1'
+    department = request.args.get('department', None, type=str)
+    position = request.args.get('position', None, type=str)
+    
+    # Validate pagination parameters
+    if page < 1:
+        page = 1
+    if per_page < 1 or per_page > 100:
+        per_page = 10
+    
+    if cursor is not None:
+        cursor = decode_cursor(cursor)
+        if cursor is None:
+            return json_response({
+                'status': 'error',
+                'message': 'Invalid cursor'
+            }, 400)
+    
+    # Get the encoded page from the service (cached until the next write)
+    etag, body = EmployeeService.get_employees_page(
+        page=page,
+        per_page=per_page,
+        department=department,
+        position=position,
+        after_id=after_id,
+        cursor=cursor,
+        with_total=with_total
+    )
+    
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    return cache_headers(raw_json_response(body, 200), etag)
 
 
 @bp.route('/<int:employee_id>', methods=['GET'])
+@safe_json('Error retrieving employee')
 def get_employee(employee_id):
     """
     Get a single employee by ID.
     
+    Responses carry a weak ETag; a matching If-None-Match returns 304.
+    
     Args:
         employee_id (int): Employee ID
     
     Returns:
         JSON response with employee data
     """
-    try:
-        employee = EmployeeService.get_employee_by_id(employee_id)
-        
-        if not employee:
-            return jsonify({
-                'status': 'error',
-                'message': f'Employee with ID {employee_id} not found'
-            }), 404
-        
-        # Serialize employee with tasks
-        result = employee_schema.dump(employee)
-        result['tasks'] = [task.to_dict() for task in employee.tasks.all()]
-        
-        return jsonify({
-            'status': 'success',
-            'data': result
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    employee = EmployeeService.get_employee_by_id(employee_id)
+    
+    if not employee:
+        return json_response({
             'status': 'error',
-            'message': f'Error retrieving employee: {str(e)}'
-        }), 500
+            'message': f'Employee with ID {employee_id} not found'
+        }, 404)
+    
+    # Skip serialization entirely when the client already has this version
+    etag = resource_etag(employee, employee.tasks)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    # Serialize employee with the tasks selectin-loaded alongside it
+    result = employee.to_dict(tasks=employee.tasks)
+    
+    response = json_response({
+        'status': 'success',
+        'data': result
+    }, 200)
+    return cache_headers(response, etag)
 
 
 @bp.route('', methods=['POST'])
+@safe_json('Error creating employee')
 def create_employee():
     """
     Create a new employee.
@@ -117,43 +129,66 @@ def create_employee():
     Returns:
         JSON response with created employee data
     """
-    try:
-        # Validate request data
-        data = employee_schema.load(request.json)
-        
-        # Create employee
-        employee, error = EmployeeService.create_employee(data)
-        
-        if error:
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), 400
-        
-        # Serialize response
-        result = employee_schema.dump(employee)
-        result['tasks'] = []  # New employee has no tasks
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Employee created successfully',
-            'data': result
-        }), 201
-        
-    except ValidationError as e:
-        return jsonify({
+    # Validate request data
+    data = employee_schema.load(request.json)
+    
+    # Create employee
+    employee, error = EmployeeService.create_employee(data)
+    
+    if error:
+        return json_response({
+            'status': 'error',
+            'message': error
+        }, 400)
+    
+    # Serialize response
+    result = employee.to_dict(tasks=[])  # New employee has no tasks
+    
+    return json_response({
+        'status': 'success',
+        'message': 'Employee created successfully',
+        'data': result
+    }, 201)
+
+
+@bp.route('/bulk', methods=['POST'])
+@safe_json('Error creating employees')
+def create_employees():
+    """
+    Create several employees at once.
+    
+    Request Body:
+        JSON array of employee objects
+    
+    Returns:
+        JSON response with the number of employees created
+    """
+    # Validate every item; any invalid item rejects the whole batch
+    data = employees_schema.load(request.json)
+    
+    if not data:
+        return json_response({
             'status': 'error',
-            'message': 'Validation failed',
-            'errors': e.messages
-        }), 400
-    except Exception as e:
-        return jsonify({
+            'message': 'No employees provided'
+        }, 400)
+    
+    count, error = EmployeeService.create_employees(data)
+    
+    if error:
+        return json_response({
             'status': 'error',
-            'message': f'Error creating employee: {str(e)}'
-        }), 500
+            'message': error
+        }, 400)
+    
+    return json_response({
+        'status': 'success',
+        'message': f'{count} employees created successfully',
+        'count': count
+    }, 201)
 
 
 @bp.route('/<int:employee_id>', methods=['PUT'])
+@safe_json('Error updating employee')
 def update_employee(employee_id):
     """
     Update an existing employee.
@@ -167,50 +202,37 @@ def update_employee(employee_id):
     Returns:
         JSON response with updated employee data
     """
-    try:
-        # Validate request data
-        data = employee_update_schema.load(request.json)
-        
-        if not data:
-            return jsonify({
-                'status': 'error',
-                'message': 'No data provided for update'
-            }), 400
-        
-        # Update employee
-        employee, error = EmployeeService.update_employee(employee_id, data)
-        
-        if error:
-            status_code = 404 if 'not found' in error.lower() else 400
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), status_code
-        
-        # Serialize response
-        result = employee_schema.dump(employee)
-        result['tasks'] = [task.to_dict() for task in employee.tasks.all()]
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Employee updated successfully',
-            'data': result
-        }), 200
-        
-    except ValidationError as e:
-        return jsonify({
+    # Validate request data
+    data = employee_update_schema.load(request.json)
+    
+    if not data:
+        return json_response({
             'status': 'error',
-            'message': 'Validation failed',
-            'errors': e.messages
-        }), 400
-    except Exception as e:
-        return jsonify({
+            'message': 'No data provided for update'
+        }, 400)
+    
+    # Update employee
+    employee, error = EmployeeService.update_employee(employee_id, data)
+    
+    if error:
+        status_code = 404 if 'not found' in error.lower() else 400
+        return json_response({
             'status': 'error',
-            'message': f'Error updating employee: {str(e)}'
-        }), 500
+            'message': error
+        }, status_code)
+    
+    # Serialize response
+    result = employee.to_dict(include_tasks=True)
+    
+    return json_response({
+        'status': 'success',
+        'message': 'Employee updated successfully',
+        'data': result
+    }, 200)
 
 
 @bp.route('/<int:employee_id>', methods=['DELETE'])
+@safe_json('Error deleting employee')
 def delete_employee(employee_id):
     """
     Delete an employee.
@@ -221,29 +243,23 @@ def delete_employee(employee_id):
     Returns:
         JSON response confirming deletion
     """
-    try:
-        success, error = EmployeeService.delete_employee(employee_id)
-        
-        if not success:
-            status_code = 404 if 'not found' in error.lower() else 500
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), status_code
-        
-        return jsonify({
-            'status': 'success',
-            'message': f'Employee with ID {employee_id} deleted successfully'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    success, error = EmployeeService.delete_employee(employee_id)
+    
+    if not success:
+        status_code = 404 if 'not found' in error.lower() else 500
+        return json_response({
             'status': 'error',
-            'message': f'Error deleting employee: {str(e)}'
-        }), 500
+            'message': error
+        }, status_code)
+    
+    return json_response({
+        'status': 'success',
+        'message': f'Employee with ID {employee_id} deleted successfully'
+    }, 200)
 
 
 @bp.route('/<int:employee_id>/tasks', methods=['GET'])
+@safe_json('Error retrieving employee tasks')
 def get_employee_tasks(employee_id):
     """
     Get all tasks assigned to a specific employee.
@@ -254,26 +270,19 @@ def get_employee_tasks(employee_id):
     Returns:
         JSON response with list of tasks
     """
-    try:
-        tasks, error = EmployeeService.get_employee_tasks(employee_id)
-        
-        if error:
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), 404
-        
-        # Serialize tasks
-        result = [task.to_dict() for task in tasks]
-        
-        return jsonify({
-            'status': 'success',
-            'data': result,
-            'count': len(result)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    tasks, error = EmployeeService.get_employee_tasks(employee_id)
+    
+    if error:
+        return json_response({
             'status': 'error',
-            'message': f'Error retrieving employee tasks: {str(e)}'
-        }), 500
+            'message': error
+        }, 404)
+    
+    # Serialize tasks
+    result = [task.to_dict() for task in tasks]
+    
+    return json_response({
+        'status': 'success',
+        'data': result,
+        'count': len(result)
+    }, 200)
@@ -1,20 +1,25 @@
 """
 Task API routes for CRUD operations.
 """
-from flask import Blueprint, request, jsonify
-from marshmallow import ValidationError
-from app.services.task_service import TaskService
-from app.schemas.task_schema import (
-    task_schema,
-    tasks_schema,
-    task_update_schema
+from flask import Blueprint, request
+from app.utils.responses import (
+    cache_headers,
+    json_response,
+    not_modified,
+    raw_json_response,
+    resource_etag,
+    safe_json
 )
+from app.utils.pagination import decode_cursor
+from app.services.task_service import TaskService
+from app.schemas.task_schema import task_schema, tasks_schema, task_update_schema
 
 # Create blueprint
 bp = Blueprint('tasks', __name__, url_prefix='/api/tasks')
 
 
 @bp.route('', methods=['GET'])
+@safe_json('Error retrieving tasks')
 def get_tasks():
     """
     Get all tasks with pagination and filtering.
@@ -22,103 +27,101 @@ def get_tasks():
     Query Parameters:
         page (int): Page number (default: 1)
         per_page (int): Items per page (default: 10)
+        after_id (int): Return items after this ID (keyset pagination, no totals)
+        cursor (str): next_cursor from a previous page (newest-first seek, no totals)
+        with_total (int): Pass 1 to include total and pages in pagination info
         status (str): Filter by status
         priority (str): Filter by priority
         employee_id (int): Filter by assigned employee
     
+    Responses carry a weak ETag; a matching If-None-Match returns 304.
+    
     Returns:
         JSON response with tasks list and pagination info
     """
-    try:
-        # Get query parameters
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 10, type=int)
-        status = request.args.get('status', None, type=str)
-        priority = request.args.get('priority', None, type=str)
-        employee_id = request.args.get('employee_id', None, type=int)
-        
-        # Validate pagination parameters
-        if page < 1:
-            page = 1
-        if per_page < 1 or per_page > 100:
-            per_page = 10
-        
-        # Get tasks from service
-        tasks, pagination_info = TaskService.get_all_tasks(
-            page=page,
-            per_page=per_page,
-            status=status,
-            priority=priority,
-            employee_id=employee_id
-        )
-        
-        # Serialize tasks with employee info
-        result = []
-        for task in tasks:
-            task_dict = task_schema.dump(task)
-            if task.assigned_employee:
-                task_dict['employee'] = {
-                    'id': task.assigned_employee.id,
-                    'name': f"{task.assigned_employee.first_name} {task.assigned_employee.last_name}",
-                    'email': task.assigned_employee.email
-                }
-            result.append(task_dict)
-        
-        return jsonify({
-            'status': 'success',
-            'data': result,
-            'pagination': pagination_info
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': f'Error retrieving tasks: {str(e)}'
-        }), 500
+    # Get query parameters
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 10, type=int)
+    after_id = request.args.get('after_id', None, type=int)
+    cursor = request.args.get('cursor', None, type=str)
+    with_total = request.args.get('with_total') == '1'
+    status = request.args.get('status', None, type=str)
+    priority = request.args.get('priority', None, type=str)
+    employee_id = request.args.get('employee_id', None, type=int)
+    
+    # Validate pagination parameters
+    if page < 1:
+        page = 1
+    if per_page < 1 or per_page > 100:
+        per_page = 10
+    
+    if cursor is not None:
+        cursor = decode_cursor(cursor)
+        if cursor is None:
+            return json_response({
+                'status': 'error',
+                'message': 'Invalid cursor'
+            }, 400)
+    
+    # Get the encoded page from the service (cached until the next write)
+    etag, body = TaskService.get_tasks_page(
+        page=page,
+        per_page=per_page,
+        status=status,
+        priority=priority,
+        employee_id=employee_id,
+        after_id=after_id,
+        cursor=cursor,
+        with_total=with_total
+    )
+    
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    return cache_headers(raw_json_response(body, 200), etag)
 
 
 @bp.route('/<int:task_id>', methods=['GET'])
+@safe_json('Error retrieving task')
 def get_task(task_id):
     """
     Get a single task by ID.
     
+    Responses carry a weak ETag; a matching If-None-Match returns 304.
+    
     Args:
         task_id (int): Task ID
     
     Returns:
         JSON response with task data
     """
-    try:
-        task = TaskService.get_task_by_id(task_id)
-        
-        if not task:
-            return jsonify({
-                'status': 'error',
-                'message': f'Task with ID {task_id} not found'
-            }), 404
-        
-        # Serialize task with employee info
-        result = task_schema.dump(task)
-        if task.assigned_employee:
-            result['employee'] = {
-                'id': task.assigned_employee.id,
-                'name': f"{task.assigned_employee.first_name} {task.assigned_employee.last_name}",
-                'email': task.assigned_employee.email
-            }
-        
-        return jsonify({
-            'status': 'success',
-            'data': result
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    task = TaskService.get_task_by_id(task_id)
+    
+    if not task:
+        return json_response({
             'status': 'error',
-            'message': f'Error retrieving task: {str(e)}'
-        }), 500
+            'message': f'Task with ID {task_id} not found'
+        }, 404)
+    
+    # Skip serialization entirely when the client already has this version
+    etag = resource_etag(task, [task.assigned_employee])
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    # Serialize task with employee info
+    result = task.to_dict(include_employee=True)
+    
+    response = json_response({
+        'status': 'success',
+        'data': result
+    }, 200)
+    return cache_headers(response, etag)
 
 
 @bp.route('', methods=['POST'])
+@safe_json('Error creating task')
 def create_task():
     """
     Create a new task.
@@ -129,42 +132,66 @@ def create_task():
     Returns:
         JSON response with created task data
     """
-    try:
-        # Validate request data
-        data = task_schema.load(request.json)
-        
-        # Create task
-        task, error = TaskService.create_task(data)
-        
-        if error:
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), 400
-        
-        # Serialize response
-        result = task_schema.dump(task)
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Task created successfully',
-            'data': result
-        }), 201
-        
-    except ValidationError as e:
-        return jsonify({
+    # Validate request data
+    data = task_schema.load(request.json)
+    
+    # Create task
+    task, error = TaskService.create_task(data)
+    
+    if error:
+        return json_response({
+            'status': 'error',
+            'message': error
+        }, 400)
+    
+    # Serialize response
+    result = task.to_dict()
+    
+    return json_response({
+        'status': 'success',
+        'message': 'Task created successfully',
+        'data': result
+    }, 201)
+
+
+@bp.route('/bulk', methods=['POST'])
+@safe_json('Error creating tasks')
+def create_tasks():
+    """
+    Create several tasks at once.
+    
+    Request Body:
+        JSON array of task objects
+    
+    Returns:
+        JSON response with the number of tasks created
+    """
+    # Validate every item; any invalid item rejects the whole batch
+    data = tasks_schema.load(request.json)
+    
+    if not data:
+        return json_response({
             'status': 'error',
-            'message': 'Validation failed',
-            'errors': e.messages
-        }), 400
-    except Exception as e:
-        return jsonify({
+            'message': 'No tasks provided'
+        }, 400)
+    
+    count, error = TaskService.create_tasks(data)
+    
+    if error:
+        return json_response({
             'status': 'error',
-            'message': f'Error creating task: {str(e)}'
-        }), 500
+            'message': error
+        }, 400)
+    
+    return json_response({
+        'status': 'success',
+        'message': f'{count} tasks created successfully',
+        'count': count
+    }, 201)
 
 
 @bp.route('/<int:task_id>', methods=['PUT'])
+@safe_json('Error updating task')
 def update_task(task_id):
     """
     Update an existing task.
@@ -178,49 +205,37 @@ def update_task(task_id):
     Returns:
         JSON response with updated task data
     """
-    try:
-        # Validate request data
-        data = task_update_schema.load(request.json)
-        
-        if not data:
-            return jsonify({
-                'status': 'error',
-                'message': 'No data provided for update'
-            }), 400
-        
-        # Update task
-        task, error = TaskService.update_task(task_id, data)
-        
-        if error:
-            status_code = 404 if 'not found' in error.lower() else 400
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), status_code
-        
-        # Serialize response
-        result = task_schema.dump(task)
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Task updated successfully',
-            'data': result
-        }), 200
-        
-    except ValidationError as e:
-        return jsonify({
+    # Validate request data
+    data = task_update_schema.load(request.json)
+    
+    if not data:
+        return json_response({
             'status': 'error',
-            'message': 'Validation failed',
-            'errors': e.messages
-        }), 400
-    except Exception as e:
-        return jsonify({
+            'message': 'No data provided for update'
+        }, 400)
+    
+    # Update task
+    task, error = TaskService.update_task(task_id, data)
+    
+    if error:
+        status_code = 404 if 'not found' in error.lower() else 400
+        return json_response({
             'status': 'error',
-            'message': f'Error updating task: {str(e)}'
-        }), 500
+            'message': error
+        }, status_code)
+    
+    # Serialize response
+    result = task.to_dict()
+    
+    return json_response({
+        'status': 'success',
+        'message': 'Task updated successfully',
+        'data': result
+    }, 200)
 
 
 @bp.route('/<int:task_id>', methods=['DELETE'])
+@safe_json('Error deleting task')
 def delete_task(task_id):
     """
     Delete a task.
@@ -231,23 +246,16 @@ def delete_task(task_id):
     Returns:
         JSON response confirming deletion
     """
-    try:
-        success, error = TaskService.delete_task(task_id)
-        
-        if not success:
-            status_code = 404 if 'not found' in error.lower() else 500
-            return jsonify({
-                'status': 'error',
-                'message': error
-            }), status_code
-        
-        return jsonify({
-            'status': 'success',
-            'message': f'Task with ID {task_id} deleted successfully'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    success, error = TaskService.delete_task(task_id)
+    
+    if not success:
+        status_code = 404 if 'not found' in error.lower() else 500
+        return json_response({
             'status': 'error',
-            'message': f'Error deleting task: {str(e)}'
-        }), 500
+            'message': error
+        }, status_code)
+    
+    return json_response({
+        'status': 'success',
+        'message': f'Task with ID {task_id} deleted successfully'
+    }, 200)
@@ -1,9 +1,13 @@
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import Schema, fields, validate, validates, ValidationError, EXCLUDE
 from app.models.employee import Employee
+from app.utils.validators import validate_email
 
 
 class EmployeeSchema(Schema):
-    """Schema for Employee validation and serialization."""
+    """Schema for Employee request validation (responses use Employee.to_dict)."""
+    
+    class Meta:
+        unknown = EXCLUDE
     
     id = fields.Int(dump_only=True)
     
@@ -17,10 +21,7 @@ class EmployeeSchema(Schema):
         validate=validate.Length(min=2, max=100, error="Last name must be between 2 and 100 characters")
     )
     
-    email = fields.Email(
-        required=True,
-        error_messages={'invalid': 'Invalid email format'}
-    )
+    email = fields.Str(required=True)
     
     phone = fields.Str(
         required=False,
@@ -49,18 +50,19 @@ class EmployeeSchema(Schema):
     created_at = fields.DateTime(dump_only=True, format='iso')
     updated_at = fields.DateTime(dump_only=True, format='iso')
     
-    # Include tasks when requested
-    tasks = fields.List(fields.Dict(), dump_only=True)
-    
     @validates('email')
-    def validate_email_unique(self, value):
-
-        pass
+    def validate_email_format(self, value):
+        """Reject malformed email addresses."""
+        if not validate_email(value):
+            raise ValidationError('Invalid email format')
 
 
 class EmployeeUpdateSchema(Schema):
     """Schema for updating employee (all fields optional)."""
     
+    class Meta:
+        unknown = EXCLUDE
+    
     first_name = fields.Str(
         required=False,
         validate=validate.Length(min=2, max=100)
@@ -71,7 +73,7 @@ class EmployeeUpdateSchema(Schema):
         validate=validate.Length(min=2, max=100)
     )
     
-    email = fields.Email(required=False)
+    email = fields.Str(required=False)
     
     phone = fields.Str(
         required=False,
@@ -96,6 +98,12 @@ class EmployeeUpdateSchema(Schema):
         allow_none=True,
         format='%Y-%m-%d'
     )
+    
+    @validates('email')
+    def validate_email_format(self, value):
+        """Reject malformed email addresses."""
+        if not validate_email(value):
+            raise ValidationError('Invalid email format')
 
 
 # Schema instances
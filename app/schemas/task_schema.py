@@ -1,12 +1,16 @@
 """
-Task schema for request validation and response serialization.
+Task schema for request validation.
 """
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import Schema, fields, validate, validates, ValidationError, EXCLUDE
 from app.models.task import Task
+from app.utils.validators import InSet
 
 
 class TaskSchema(Schema):
-    """Schema for Task validation and serialization."""
+    """Schema for Task request validation (responses use Task.to_dict)."""
+    
+    class Meta:
+        unknown = EXCLUDE
     
     id = fields.Int(dump_only=True)
     
@@ -22,7 +26,7 @@ class TaskSchema(Schema):
     
     status = fields.Str(
         required=False,
-        validate=validate.OneOf(
+        validate=InSet(
             Task.VALID_STATUSES,
             error="Status must be one of: pending, in_progress, completed, cancelled"
         ),
@@ -31,7 +35,7 @@ class TaskSchema(Schema):
     
     priority = fields.Str(
         required=False,
-        validate=validate.OneOf(
+        validate=InSet(
             Task.VALID_PRIORITIES,
             error="Priority must be one of: low, medium, high, urgent"
         ),
@@ -51,14 +55,14 @@ class TaskSchema(Schema):
     
     created_at = fields.DateTime(dump_only=True, format='iso')
     updated_at = fields.DateTime(dump_only=True, format='iso')
-    
-    # Include employee details when requested
-    employee = fields.Dict(dump_only=True)
 
 
 class TaskUpdateSchema(Schema):
     """Schema for updating task (all fields optional)."""
     
+    class Meta:
+        unknown = EXCLUDE
+    
     title = fields.Str(
         required=False,
         validate=validate.Length(min=3, max=200)
@@ -71,12 +75,12 @@ class TaskUpdateSchema(Schema):
     
     status = fields.Str(
         required=False,
-        validate=validate.OneOf(Task.VALID_STATUSES)
+        validate=InSet(Task.VALID_STATUSES)
     )
     
     priority = fields.Str(
         required=False,
-        validate=validate.OneOf(Task.VALID_PRIORITIES)
+        validate=InSet(Task.VALID_PRIORITIES)
     )
     
     employee_id = fields.Int(
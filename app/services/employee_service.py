@@ -1,16 +1,29 @@
 """
 Employee service containing business logic for employee operations.
 """
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from app import db
 from app.models.employee import Employee
+from app.models.task import Task
+from app.utils.caching import cache, invalidate_lists, list_generation
+from app.utils.loading import strict_loading_options
+from app.utils.pagination import cursor_paginate, keyset_paginate, offset_paginate
+from app.utils.responses import body_etag, json_body
+
+# Columns a client may change (set membership instead of hasattr per field)
+_EMPLOYEE_UPDATABLE_FIELDS = frozenset(
+    column.name for column in Employee.__table__.columns
+) - {'id', 'created_at', 'updated_at'}
 
 
 class EmployeeService:
     """Service class for employee-related business logic."""
     
     @staticmethod
-    def get_all_employees(page=1, per_page=10, department=None, position=None):
+    def get_all_employees(page=1, per_page=10, department=None, position=None,
+                          after_id=None, cursor=None, with_total=False):
         """
         Retrieve all employees with pagination and filtering.
         
@@ -19,38 +32,59 @@ class EmployeeService:
             per_page (int): Items per page
             department (str): Filter by department
             position (str): Filter by position
+            after_id (int): Use keyset pagination, returning employees after this ID
+            cursor (tuple): Decoded (created_at, id) cursor; returns the employees after it
+            with_total (bool): Include total/pages (runs a COUNT query)
             
         Returns:
             tuple: (list of employees, pagination info)
         """
-        query = Employee.query
+        # Load tasks for the whole page in one extra query instead of one per employee
+        stmt = select(Employee).options(
+            selectinload(Employee.tasks),
+            *strict_loading_options()
+        )
         
         # Apply filters
         if department:
-            query = query.filter(Employee.department.ilike(f'%{department}%'))
+            stmt = stmt.where(Employee.department.ilike(f'%{department}%'))
         if position:
-            query = query.filter(Employee.position.ilike(f'%{position}%'))
+            stmt = stmt.where(Employee.position.ilike(f'%{position}%'))
         
-        # Order by creation date (newest first)
-        query = query.order_by(Employee.created_at.desc())
+        # Keyset/cursor pagination skips the COUNT(*) and the OFFSET scan
+        if after_id is not None:
+            return keyset_paginate(stmt, Employee.id, after_id, per_page)
+        if cursor is not None:
+            return cursor_paginate(stmt, Employee.created_at, Employee.id, cursor, per_page)
         
-        # Paginate
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        # Order by creation date (newest first), served by ix_emp_created_id
+        stmt = stmt.order_by(Employee.created_at.desc(), Employee.id.desc())
         
-        pagination_info = {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        # Paginate (COUNT(*) only when the caller asks for totals)
+        return offset_paginate(stmt, page, per_page, with_total)
+    
+    @staticmethod
+    def get_employees_page(page=1, per_page=10, department=None, position=None,
+                           after_id=None, cursor=None, with_total=False):
+        """
+        Return an employee list page as (ETag, JSON body), cached until the next write.
         
-        return pagination.items, pagination_info
+        Args:
+            page (int): Page number
+            per_page (int): Items per page
+            department (str): Filter by department
+            position (str): Filter by position
+            after_id (int): Use keyset pagination, returning employees after this ID
+            cursor (tuple): Decoded (created_at, id) cursor; returns the employees after it
+            with_total (bool): Include total/pages (runs a COUNT query)
+            
+        Returns:
+            tuple: (ETag value, encoded {'status', 'data', 'pagination'} body)
+        """
+        return _cached_employees_page(
+            list_generation(), page, per_page, department, position, after_id, cursor,
+            with_total
+        )
     
     @staticmethod
     def get_employee_by_id(employee_id):
@@ -63,7 +97,6 @@ class EmployeeService:
         Returns:
             Employee or None: Employee object if found
         """
-        from app import db
         return db.session.get(Employee, employee_id)
     
     @staticmethod
@@ -78,11 +111,6 @@ class EmployeeService:
             tuple: (Employee object or None, error message or None)
         """
         try:
-            # Check if email already exists
-            existing = Employee.query.filter_by(email=data.get('email')).first()
-            if existing:
-                return None, 'Email already exists'
-            
             # Create new employee directly (data is already validated by Marshmallow)
             employee = Employee(
                 first_name=data.get('first_name'),
@@ -96,16 +124,44 @@ class EmployeeService:
             
             db.session.add(employee)
             db.session.commit()
+            invalidate_lists()
             
             return employee, None
             
-        except IntegrityError as e:
+        except IntegrityError:
+            # The unique email index is the only constraint the schema doesn't check
             db.session.rollback()
-            return None, 'Database integrity error: Email must be unique'
+            return None, 'Email already exists'
         except Exception as e:
             db.session.rollback()
             return None, f'Error creating employee: {str(e)}'
     
+    @staticmethod
+    def create_employees(data_list):
+        """
+        Create several employees in a single transaction.
+        
+        Args:
+            data_list (list): Employee data dicts (already validated by Marshmallow)
+            
+        Returns:
+            tuple: (number of employees created or None, error message or None)
+        """
+        try:
+            # One executemany INSERT and one COMMIT for the whole batch
+            db.session.bulk_insert_mappings(Employee, data_list)
+            db.session.commit()
+            invalidate_lists()
+            
+            return len(data_list), None
+            
+        except IntegrityError:
+            db.session.rollback()
+            return None, 'Database integrity error: Email must be unique'
+        except Exception as e:
+            db.session.rollback()
+            return None, f'Error creating employees: {str(e)}'
+    
     @staticmethod
     def update_employee(employee_id, data):
         """
@@ -119,28 +175,34 @@ class EmployeeService:
             tuple: (Employee object or None, error message or None)
         """
         try:
-            employee = db.session.get(Employee, employee_id)
-
+            if db.session.get_bind().dialect.update_returning:
+                # One UPDATE ... RETURNING instead of a SELECT followed by an UPDATE
+                employee = db.session.execute(
+                    update(Employee)
+                    .where(Employee.id == employee_id)
+                    .values(**{key: value for key, value in data.items() if key in _EMPLOYEE_UPDATABLE_FIELDS})
+                    .returning(Employee)
+                ).scalar_one_or_none()
+            else:
+                employee = db.session.get(Employee, employee_id)
+                
+                # Update fields
+                if employee:
+                    for key, value in data.items():
+                        if key in _EMPLOYEE_UPDATABLE_FIELDS:
+                            setattr(employee, key, value)
+            
             if not employee:
+                db.session.rollback()
                 return None, 'Employee not found'
             
-            # Check email uniqueness if email is being updated
-            if 'email' in data and data['email'] != employee.email:
-                existing = Employee.query.filter_by(email=data['email']).first()
-                if existing:
-                    return None, 'Email already exists'
-            
-            # Update fields
-            for key, value in data.items():
-                if hasattr(employee, key):
-                    setattr(employee, key, value)
-            
             db.session.commit()
+            invalidate_lists()
             return employee, None
             
         except IntegrityError:
             db.session.rollback()
-            return None, 'Database integrity error: Email must be unique'
+            return None, 'Email already exists'
         except Exception as e:
             db.session.rollback()
             return None, f'Error updating employee: {str(e)}'
@@ -164,6 +226,7 @@ class EmployeeService:
             
             db.session.delete(employee)
             db.session.commit()
+            invalidate_lists()
             return True, None
             
         except Exception as e:
@@ -181,10 +244,44 @@ class EmployeeService:
         Returns:
             tuple: (list of tasks or None, error message or None)
         """
-        employee = db.session.get(Employee, employee_id)
-
-        if not employee:
-            return None, 'Employee not found'
+        # Query the tasks directly; the employee only needs checking for an empty result
+        tasks = db.session.scalars(
+            select(Task)
+            .where(Task.employee_id == employee_id)
+            .options(*strict_loading_options())
+        ).all()
+        
+        if not tasks:
+            # Tell an employee without tasks apart from a missing one
+            found = db.session.scalar(select(Employee.id).where(Employee.id == employee_id))
+            if found is None:
+                return None, 'Employee not found'
         
-        tasks = employee.tasks.all()
         return tasks, None
+
+
+@cache.memoize()
+def _cached_employees_page(generation, page, per_page, department, position, after_id,
+                           cursor, with_total):
+    """Encode and hash one page of employees; generation keys out stale entries."""
+    employees, pagination_info = EmployeeService.get_all_employees(
+        page=page,
+        per_page=per_page,
+        department=department,
+        position=position,
+        after_id=after_id,
+        cursor=cursor,
+        with_total=with_total
+    )
+    
+    # Tasks are already loaded for the whole page via selectinload
+    result = [employee.to_dict(include_tasks=True) for employee in employees]
+    
+    # Cache the encoded body (and its ETag) so a hit skips both the ORM and orjson
+    body = json_body({
+        'status': 'success',
+        'data': result,
+        'pagination': pagination_info
+    })
+    
+    return body_etag(body), body
@@ -1,17 +1,29 @@
 """
 Task service containing business logic for task operations.
 """
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload
 from app import db
 from app.models.task import Task
 from app.models.employee import Employee
+from app.utils.caching import cache, invalidate_lists, list_generation
+from app.utils.loading import strict_loading_options
+from app.utils.pagination import cursor_paginate, keyset_paginate, offset_paginate
+from app.utils.responses import body_etag, json_body
+
+# Columns a client may change (set membership instead of hasattr per field)
+_TASK_UPDATABLE_FIELDS = frozenset(
+    column.name for column in Task.__table__.columns
+) - {'id', 'created_at', 'updated_at'}
 
 
 class TaskService:
     """Service class for task-related business logic."""
     
     @staticmethod
-    def get_all_tasks(page=1, per_page=10, status=None, priority=None, employee_id=None):
+    def get_all_tasks(page=1, per_page=10, status=None, priority=None, employee_id=None,
+                      after_id=None, cursor=None, with_total=False):
         """
         Retrieve all tasks with pagination and filtering.
         
@@ -21,40 +33,63 @@ class TaskService:
             status (str): Filter by status
             priority (str): Filter by priority
             employee_id (int): Filter by assigned employee
+            after_id (int): Use keyset pagination, returning tasks after this ID
+            cursor (tuple): Decoded (created_at, id) cursor; returns the tasks after it
+            with_total (bool): Include total/pages (runs a COUNT query)
             
         Returns:
             tuple: (list of tasks, pagination info)
         """
-        query = Task.query
+        # Every row needs its assigned employee, so let the JOIN populate it
+        stmt = select(Task).outerjoin(Task.assigned_employee).options(
+            contains_eager(Task.assigned_employee).lazyload(Employee.tasks),
+            *strict_loading_options()
+        )
         
         # Apply filters
         if status:
-            query = query.filter(Task.status == status)
+            stmt = stmt.where(Task.status == status)
         if priority:
-            query = query.filter(Task.priority == priority)
+            stmt = stmt.where(Task.priority == priority)
         if employee_id:
-            query = query.filter(Task.employee_id == employee_id)
+            stmt = stmt.where(Task.employee_id == employee_id)
         
-        # Order by creation date (newest first)
-        query = query.order_by(Task.created_at.desc())
+        # Keyset/cursor pagination skips the COUNT(*) and the OFFSET scan
+        if after_id is not None:
+            return keyset_paginate(stmt, Task.id, after_id, per_page)
+        if cursor is not None:
+            return cursor_paginate(stmt, Task.created_at, Task.id, cursor, per_page)
         
-        # Paginate
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        # Order by creation date (newest first); the (filter, created_at)
+        # indexes let a single filter read rows in order instead of sorting
+        stmt = stmt.order_by(Task.created_at.desc(), Task.id.desc())
         
-        pagination_info = {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        # Paginate (COUNT(*) only when the caller asks for totals)
+        return offset_paginate(stmt, page, per_page, with_total)
+    
+    @staticmethod
+    def get_tasks_page(page=1, per_page=10, status=None, priority=None, employee_id=None,
+                       after_id=None, cursor=None, with_total=False):
+        """
+        Return a task list page as (ETag, JSON body), cached until the next write.
         
-        return pagination.items, pagination_info
+        Args:
+            page (int): Page number
+            per_page (int): Items per page
+            status (str): Filter by status
+            priority (str): Filter by priority
+            employee_id (int): Filter by assigned employee
+            after_id (int): Use keyset pagination, returning tasks after this ID
+            cursor (tuple): Decoded (created_at, id) cursor; returns the tasks after it
+            with_total (bool): Include total/pages (runs a COUNT query)
+            
+        Returns:
+            tuple: (ETag value, encoded {'status', 'data', 'pagination'} body)
+        """
+        return _cached_tasks_page(
+            list_generation(), page, per_page, status, priority, employee_id, after_id, cursor,
+            with_total
+        )
     
     @staticmethod
     def get_task_by_id(task_id):
@@ -67,8 +102,10 @@ class TaskService:
         Returns:
             Task or None: Task object if found
         """
-        from app import db
-        return db.session.get(Task, task_id)
+        return db.session.get(
+            Task, task_id,
+            options=[joinedload(Task.assigned_employee).lazyload(Employee.tasks)]
+        )
     
     @staticmethod
     def create_task(data):
@@ -82,14 +119,6 @@ class TaskService:
             tuple: (Task object or None, error message or None)
         """
         try:
-            # Validate employee_id if provided
-            employee_id = data.get('employee_id')
-            if employee_id:
-                employee = db.session.get(Employee, employee_id)
-
-                if not employee:
-                    return None, f'Employee with ID {employee_id} not found'
-            
             # Create new task directly (data is already validated by Marshmallow)
             task = Task(
                 title=data.get('title'),
@@ -102,13 +131,48 @@ class TaskService:
             
             db.session.add(task)
             db.session.commit()
+            invalidate_lists()
             
             return task, None
             
+        except IntegrityError as e:
+            # The employee_id foreign key replaces a SELECT of the employee up front
+            db.session.rollback()
+            if 'foreign key' in str(e.orig).lower():
+                return None, f'Employee with ID {data.get("employee_id")} not found'
+            return None, f'Error creating task: {str(e)}'
         except Exception as e:
             db.session.rollback()
             return None, f'Error creating task: {str(e)}'
     
+    @staticmethod
+    def create_tasks(data_list):
+        """
+        Create several tasks in a single transaction.
+        
+        Args:
+            data_list (list): Task data dicts (already validated by Marshmallow)
+            
+        Returns:
+            tuple: (number of tasks created or None, error message or None)
+        """
+        try:
+            # One executemany INSERT and one COMMIT for the whole batch
+            db.session.bulk_insert_mappings(Task, data_list)
+            db.session.commit()
+            invalidate_lists()
+            
+            return len(data_list), None
+            
+        except IntegrityError as e:
+            db.session.rollback()
+            if 'foreign key' in str(e.orig).lower():
+                return None, 'One or more employee IDs do not exist'
+            return None, f'Error creating tasks: {str(e)}'
+        except Exception as e:
+            db.session.rollback()
+            return None, f'Error creating tasks: {str(e)}'
+    
     @staticmethod
     def update_task(task_id, data):
         """
@@ -122,25 +186,37 @@ class TaskService:
             tuple: (Task object or None, error message or None)
         """
         try:
-            task = db.session.get(Task, task_id)
-
+            if db.session.get_bind().dialect.update_returning:
+                # One UPDATE ... RETURNING instead of a SELECT followed by an UPDATE
+                task = db.session.execute(
+                    update(Task)
+                    .where(Task.id == task_id)
+                    .values(**{key: value for key, value in data.items() if key in _TASK_UPDATABLE_FIELDS})
+                    .returning(Task)
+                ).scalar_one_or_none()
+            else:
+                task = db.session.get(Task, task_id)
+                
+                # Update fields
+                if task:
+                    for key, value in data.items():
+                        if key in _TASK_UPDATABLE_FIELDS:
+                            setattr(task, key, value)
+            
             if not task:
+                db.session.rollback()
                 return None, 'Task not found'
             
-            # Validate employee_id if being updated
-            if 'employee_id' in data and data['employee_id']:
-                employee = Employee.query.get(data['employee_id'])
-                if not employee:
-                    return None, f'Employee with ID {data["employee_id"]} not found'
-            
-            # Update fields
-            for key, value in data.items():
-                if hasattr(task, key):
-                    setattr(task, key, value)
-            
+            # An unknown employee_id fails the foreign key at flush/commit
             db.session.commit()
+            invalidate_lists()
             return task, None
             
+        except IntegrityError as e:
+            db.session.rollback()
+            if 'foreign key' in str(e.orig).lower():
+                return None, f'Employee with ID {data.get("employee_id")} not found'
+            return None, f'Error updating task: {str(e)}'
         except Exception as e:
             db.session.rollback()
             return None, f'Error updating task: {str(e)}'
@@ -164,8 +240,37 @@ class TaskService:
             
             db.session.delete(task)
             db.session.commit()
+            invalidate_lists()
             return True, None
             
         except Exception as e:
             db.session.rollback()
             return False, f'Error deleting task: {str(e)}'
+
+
+@cache.memoize()
+def _cached_tasks_page(generation, page, per_page, status, priority, employee_id, after_id,
+                       cursor, with_total):
+    """Encode and hash one page of tasks; generation keys out stale entries."""
+    tasks, pagination_info = TaskService.get_all_tasks(
+        page=page,
+        per_page=per_page,
+        status=status,
+        priority=priority,
+        employee_id=employee_id,
+        after_id=after_id,
+        cursor=cursor,
+        with_total=with_total
+    )
+    
+    # Serialize tasks with employee info
+    result = [task.to_dict(include_employee=True) for task in tasks]
+    
+    # Cache the encoded body (and its ETag) so a hit skips both the ORM and orjson
+    body = json_body({
+        'status': 'success',
+        'data': result,
+        'pagination': pagination_info
+    })
+    
+    return body_etag(body), body
@@ -1,6 +1,18 @@
 """
 Utils package initialization.
+
+Submodules are not imported here: app/__init__.py needs app.utils.caching
+and app.utils.database at import time, and importing the whole package
+would pull in orjson, marshmallow and the response helpers with them.
+Import them directly, e.g. `from app.utils import error_handlers`.
 """
-from app.utils import error_handlers, validators
 
-__all__ = ['error_handlers', 'validators']
+__all__ = [
+    'caching',
+    'database',
+    'error_handlers',
+    'loading',
+    'pagination',
+    'responses',
+    'validators'
+]
@@ -0,0 +1,35 @@
+"""
+Cache shared by the list endpoints.
+"""
+import time
+from flask_caching import Cache
+
+cache = Cache()
+
+# Cached list pages are keyed by this value; one write to either table
+# replaces it, which retires every cached employee and task page at once
+# (the employee list embeds tasks and the task list embeds employees)
+LIST_GENERATION_KEY = 'lists:generation'
+
+
+def list_generation():
+    """
+    Return the current list cache generation.
+    
+    A missing (evicted or never set) generation is replaced with a fresh
+    value so pages cached under an older one can never be served again.
+    
+    Returns:
+        int: Generation to include in list cache keys
+    """
+    generation = cache.get(LIST_GENERATION_KEY)
+    if generation is None:
+        generation = time.time_ns()
+        cache.set(LIST_GENERATION_KEY, generation, timeout=0)
+    
+    return generation
+
+
+def invalidate_lists():
+    """Retire every cached list page after employees or tasks change."""
+    cache.set(LIST_GENERATION_KEY, time.time_ns(), timeout=0)
@@ -0,0 +1,184 @@
+"""
+Database engine tuning applied when the application is created.
+"""
+import os
+from flask import has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import DateTime, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+# Bind key of the read-only SQLite engine used by safe (GET) requests
+READER_BIND = 'reader'
+
+# pg_advisory_xact_lock key serializing schema creation between workers
+SCHEMA_LOCK_ID = 7311
+
+READ_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+class utcnow(FunctionElement):
+    """Current UTC time computed by the database, for column defaults."""
+    
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, 'sqlite')
+def _utcnow_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is whole seconds on SQLite; keep milliseconds, padded
+    # to the six fractional digits SQLAlchemy uses for bound datetimes so
+    # stored and compared values sort the same way as text. Writes to one row
+    # within the same millisecond share a value, so resource_etag (which uses
+    # updated_at as the row version) is only exact on PostgreSQL
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class RoutingSession(Session):
+    """Session that sends safe requests to the read-only engine when configured."""
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """Use the reader engine for GET/HEAD/OPTIONS requests, else the default bind."""
+        if (
+            bind is None
+            and READER_BIND in self._db.engines
+            and has_request_context()
+            and request.method in READ_METHODS
+        ):
+            return self._db.engines[READER_BIND]
+        
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def create_tables(db):
+    """
+    Create any missing tables, one worker at a time on PostgreSQL.
+    
+    Every gunicorn worker runs create_app; without the advisory lock two of
+    them can both see a table missing and race on CREATE TABLE.
+    
+    Args:
+        db: Flask-SQLAlchemy extension (inside an application context)
+    """
+    if db.engine.dialect.name != 'postgresql':
+        db.create_all()
+        return
+    
+    with db.engine.begin() as connection:
+        connection.execute(text('SELECT pg_advisory_xact_lock(:id)'), {'id': SCHEMA_LOCK_ID})
+        db.metadata.create_all(connection)
+
+
+def _is_sqlite_file(url):
+    """Check whether a URL points at a file-backed SQLite database."""
+    return (
+        url.get_backend_name() == 'sqlite'
+        and url.database not in (None, '', ':memory:')
+        and url.query.get('mode') != 'memory'
+    )
+
+
+def configure_read_write_split(app):
+    """
+    Split a file-backed SQLite database into a writer and a reader pool.
+    
+    The default bind becomes the single-connection writer and a read-only
+    READER_BIND engine serves safe requests. Must run before db.init_app.
+    
+    Args:
+        app: Flask application instance
+    """
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI')
+    if not app.config.get('SQLITE_SPLIT_READ_WRITE') or not uri:
+        return
+    
+    url = make_url(uri)
+    if not _is_sqlite_file(url):
+        return
+    
+    base_options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    
+    # One writer connection: SQLite allows a single writer anyway, queueing
+    # in the pool avoids SQLITE_BUSY retries between connections
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        **base_options,
+        'pool_size': 1,
+        'max_overflow': 0
+    }
+    
+    database = url.database
+    if url.query.get('uri'):
+        database = database[5:]
+    reader_url = url.set(
+        database=f'file:{database}',
+        query={'mode': 'ro', 'uri': 'true'}
+    )
+    
+    app.config['SQLALCHEMY_BINDS'] = {
+        **app.config.get('SQLALCHEMY_BINDS', {}),
+        READER_BIND: {
+            **base_options,
+            'url': reader_url,
+            'pool_size': os.cpu_count() or 1
+        }
+    }
+
+
+def register_sqlite_pragmas(app):
+    """
+    Apply SQLITE_PRAGMAS to every new connection on SQLite engines.
+    
+    The writer of a read/write split also opens its transactions with
+    BEGIN IMMEDIATE so the write lock is taken up front.
+    
+    Args:
+        app: Flask application instance
+    """
+    db = app.extensions['sqlalchemy']
+    pragmas = app.config.get('SQLITE_PRAGMAS') or ()
+    
+    with app.app_context():
+        engines = db.engines
+        
+        for bind_key, engine in engines.items():
+            if engine.url.get_backend_name() != 'sqlite':
+                continue
+            
+            engine_pragmas = pragmas
+            if bind_key == READER_BIND:
+                # journal_mode is persistent and needs write access; the writer sets it
+                engine_pragmas = tuple(p for p in pragmas if not p.startswith('journal_mode'))
+            
+            if engine_pragmas:
+                event.listen(engine, 'connect', _pragma_listener(engine_pragmas))
+        
+        if READER_BIND in engines and None in engines:
+            _begin_immediate(engines[None])
+
+
+def _pragma_listener(pragmas):
+    """Build a connect listener that issues the given PRAGMA statements."""
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f'PRAGMA {pragma}')
+        cursor.close()
+    
+    return set_sqlite_pragmas
+
+
+def _begin_immediate(engine):
+    """Make pysqlite emit BEGIN IMMEDIATE instead of its implicit deferred BEGIN."""
+    @event.listens_for(engine, 'connect')
+    def disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, 'begin')
+    def begin_immediate(connection):
+        connection.exec_driver_sql('BEGIN IMMEDIATE')
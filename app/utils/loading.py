@@ -0,0 +1,20 @@
+"""
+Helpers for choosing relationship loading strategies in queries.
+"""
+from flask import current_app
+from sqlalchemy.orm import raiseload
+
+
+def strict_loading_options():
+    """
+    Loader options that turn accidental lazy loads into errors.
+    
+    Enabled under DEBUG/TESTING so N+1 regressions fail in development
+    and CI instead of silently issuing one extra query per row.
+    
+    Returns:
+        list: [raiseload('*')] when strict loading is enabled, else []
+    """
+    if current_app.config.get('TESTING') or current_app.debug:
+        return [raiseload('*')]
+    return []
@@ -0,0 +1,172 @@
+"""
+Pagination helpers shared by the list services.
+"""
+import base64
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import tuple_
+
+
+def encode_cursor(item):
+    """
+    Build the opaque cursor pointing just past item in newest-first order.
+    
+    Args:
+        item: Model instance with created_at and id
+        
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = f'{item.created_at.isoformat()}|{item.id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor (str): Cursor from a previous page's next_cursor
+        
+    Returns:
+        tuple or None: (created_at, id), or None if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, item_id = raw.split('|')
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, UnicodeError):
+        return None
+
+
+def offset_paginate(stmt, page, per_page, with_total=False):
+    """
+    Return one page of an ordered select() using LIMIT/OFFSET.
+    
+    The COUNT(*) behind total/pages is only run when with_total is set;
+    otherwise has_next comes from fetching one row past the page. The
+    statement must be ordered newest first (created_at, id) so next_cursor
+    can continue in cursor mode.
+    
+    Args:
+        stmt: SQLAlchemy select() with filters and ordering applied
+        page (int): Page number
+        per_page (int): Items per page
+        with_total (bool): Whether to count matching rows for total/pages
+        
+    Returns:
+        tuple: (list of items, pagination info)
+    """
+    db = current_app.extensions['sqlalchemy']
+    
+    if with_total:
+        pagination = db.paginate(
+            stmt,
+            page=page,
+            per_page=per_page,
+            error_out=False
+        )
+        
+        pagination_info = {
+            'page': pagination.page,
+            'per_page': pagination.per_page,
+            'total': pagination.total,
+            'pages': pagination.pages,
+            'has_next': pagination.has_next,
+            'has_prev': pagination.has_prev,
+            'next_cursor': encode_cursor(pagination.items[-1]) if pagination.has_next else None
+        }
+        
+        return pagination.items, pagination_info
+    
+    # Fetch one extra row to learn whether another page exists
+    items = db.session.scalars(
+        stmt.limit(per_page + 1)
+        .offset((page - 1) * per_page)
+    ).all()
+    
+    has_next = len(items) > per_page
+    items = items[:per_page]
+    
+    pagination_info = {
+        'page': page,
+        'per_page': per_page,
+        'has_next': has_next,
+        'has_prev': page > 1,
+        'next_cursor': encode_cursor(items[-1]) if has_next else None
+    }
+    
+    return items, pagination_info
+
+
+def keyset_paginate(stmt, id_column, after_id, per_page):
+    """
+    Return the page of rows whose ID follows after_id, in ID order.
+    
+    Seeks on the primary key index instead of counting and skipping rows,
+    so every page costs the same regardless of how deep the client is.
+    
+    Args:
+        stmt: SQLAlchemy select() with filters applied (and no ordering)
+        id_column: Primary key column to seek on
+        after_id (int): Last ID the client has already seen
+        per_page (int): Items per page
+        
+    Returns:
+        tuple: (list of items, pagination info)
+    """
+    # Fetch one extra row to learn whether another page exists
+    db = current_app.extensions['sqlalchemy']
+    items = db.session.scalars(
+        stmt.where(id_column > after_id)
+        .order_by(id_column)
+        .limit(per_page + 1)
+    ).all()
+    
+    has_next = len(items) > per_page
+    items = items[:per_page]
+    
+    pagination_info = {
+        'per_page': per_page,
+        'after_id': after_id,
+        'has_next': has_next,
+        'next_after_id': items[-1].id if has_next else None
+    }
+    
+    return items, pagination_info
+
+
+def cursor_paginate(stmt, created_column, id_column, cursor, per_page):
+    """
+    Return the page of rows following cursor, newest first.
+    
+    Seeks with a (created_at, id) row-value comparison on the matching
+    composite index, so no COUNT(*) or OFFSET scan is needed.
+    
+    Args:
+        stmt: SQLAlchemy select() with filters applied (and no ordering)
+        created_column: created_at column of the listed model
+        id_column: Primary key column used as the tie-breaker
+        cursor (tuple): Decoded (created_at, id) of the last row seen
+        per_page (int): Items per page
+        
+    Returns:
+        tuple: (list of items, pagination info)
+    """
+    db = current_app.extensions['sqlalchemy']
+    items = db.session.scalars(
+        stmt.where(tuple_(created_column, id_column) < tuple_(*cursor))
+        .order_by(created_column.desc(), id_column.desc())
+        .limit(per_page + 1)
+    ).all()
+    
+    has_next = len(items) > per_page
+    items = items[:per_page]
+    
+    pagination_info = {
+        'per_page': per_page,
+        'has_next': has_next,
+        'next_cursor': encode_cursor(items[-1]) if has_next else None
+    }
+    
+    return items, pagination_info
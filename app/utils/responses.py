@@ -0,0 +1,186 @@
+"""
+JSON response helpers shared by the API routes.
+"""
+import hashlib
+from functools import wraps
+import orjson
+from flask import current_app, request
+from flask.json.provider import DefaultJSONProvider
+from marshmallow import ValidationError
+
+# Naive datetimes are stored as UTC; non-str keys appear in marshmallow
+# errors for list payloads (keyed by item index)
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.json."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
+
+
+def json_body(payload):
+    """
+    Encode a payload to JSON bytes with orjson.
+    
+    Args:
+        payload: JSON-serializable data (datetime and date values are allowed)
+        
+    Returns:
+        bytes: UTF-8 JSON document
+    """
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response encoded with orjson.
+    
+    Args:
+        payload: JSON-serializable data (datetime and date values are allowed)
+        status (int): HTTP status code
+        
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return raw_json_response(json_body(payload), status)
+
+
+def raw_json_response(body, status=200):
+    """
+    Build a JSON response from an already encoded body.
+    
+    Args:
+        body (bytes): JSON document, e.g. from json_body or the cache
+        status (int): HTTP status code
+        
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return current_app.response_class(
+        body,
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def resource_etag(obj, related=()):
+    """
+    Build a weak ETag value from an object's ID and updated_at version.
+    
+    Related objects serialized into the same response (e.g. an employee's
+    tasks) are folded in, so changing or removing one changes the tag.
+    
+    The tag is only as fine as updated_at: microseconds on PostgreSQL, but
+    milliseconds on SQLite, where two updates to a row within the same
+    millisecond keep the old tag and a client may get a stale 304. Use
+    PostgreSQL where detail responses must revalidate exactly.
+    
+    Args:
+        obj: Model instance with id and updated_at
+        related: Iterable of model instances with updated_at
+        
+    Returns:
+        str: Unquoted ETag value
+    """
+    etag = f'{obj.id}-{obj.updated_at.timestamp()}'
+    
+    related = [item for item in related if item is not None]
+    if related:
+        latest = max(item.updated_at for item in related)
+        etag = f'{etag}-{len(related)}-{latest.timestamp()}'
+    
+    return etag
+
+
+def not_modified(etag):
+    """
+    Return an empty 304 response if the request's If-None-Match matches etag.
+    
+    Args:
+        etag (str): Unquoted ETag value from resource_etag
+        
+    Returns:
+        Response or None: 304 response, or None when the client copy is stale
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    
+    return cache_headers(current_app.response_class(status=304), etag)
+
+
+def body_etag(body):
+    """
+    Build a weak ETag value from an encoded response body.
+    
+    Args:
+        body (bytes): JSON document
+        
+    Returns:
+        str: Unquoted ETag value
+    """
+    return hashlib.md5(body, usedforsecurity=False).hexdigest()
+
+
+def cache_headers(response, etag):
+    """
+    Attach the weak ETag and a private Cache-Control max-age to a response.
+    
+    Args:
+        response: Flask response (200 or 304)
+        etag (str): Unquoted ETag value
+        
+    Returns:
+        Response: The same response
+    """
+    response.set_etag(etag, weak=True)
+    response.cache_control.private = True
+    response.cache_control.max_age = current_app.config.get('HTTP_CACHE_MAX_AGE', 0)
+    return response
+
+
+def safe_json(error_message):
+    """
+    Decorate a route so failures are returned as JSON error responses.
+    
+    Marshmallow validation errors become 400 responses with field errors;
+    any other exception is logged and becomes a 500 response.
+    
+    Args:
+        error_message (str): Prefix for the 500 message, e.g. 'Error creating task'
+        
+    Returns:
+        function: Decorator for a view function
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                return view(*args, **kwargs)
+            except ValidationError as e:
+                return json_response({
+                    'status': 'error',
+                    'message': 'Validation failed',
+                    'errors': e.messages
+                }, 400)
+            except Exception as e:
+                current_app.logger.exception(error_message)
+                return json_response({
+                    'status': 'error',
+                    'message': f'{error_message}: {str(e)}'
+                }, 500)
+        
+        return wrapper
+    
+    return decorator
@@ -2,7 +2,51 @@
 Custom validators for additional validation logic.
 """
 import re
-from datetime import datetime, date
+from datetime import date
+from marshmallow import ValidationError, validate
+
+# Compiled once at import; cheaper than marshmallow's fields.Email regex.
+# Applied with fullmatch: '$' would also accept a trailing newline
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Basic phone validation (adjust regex as needed)
+_PHONE_RE = re.compile(r'^[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,9}$')
+
+
+class InSet(validate.Validator):
+    """
+    Marshmallow validator accepting only values from a fixed set.
+    
+    Like validate.OneOf, but checks membership against a frozenset.
+    """
+    
+    default_message = 'Must be one of: {choices}.'
+    
+    def __init__(self, choices, error=None):
+        self.choices = frozenset(choices)
+        self.error = error or self.default_message.format(choices=', '.join(sorted(self.choices)))
+    
+    def _repr_args(self):
+        return f'choices={sorted(self.choices)!r}'
+    
+    def __call__(self, value):
+        if value not in self.choices:
+            raise ValidationError(self.error)
+        
+        return value
+
+
+def validate_email(email):
+    """
+    Validate email address format.
+    
+    Args:
+        email (str): Email address to validate
+        
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    return bool(_EMAIL_RE.fullmatch(email))
 
 
 def validate_phone_number(phone):
@@ -18,9 +62,7 @@ def validate_phone_number(phone):
     if not phone:
         return True
     
-    # Basic phone validation (adjust regex as needed)
-    pattern = r'^[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,9}$'
-    return bool(re.match(pattern, phone))
+    return bool(_PHONE_RE.match(phone))
 
 
 def validate_date_not_future(date_value):
@@ -37,7 +79,7 @@ def validate_date_not_future(date_value):
         return True
     
     if isinstance(date_value, str):
-        date_value = datetime.strptime(date_value, '%Y-%m-%d').date()
+        date_value = date.fromisoformat(date_value)
     
     return date_value <= date.today()
 
@@ -56,6 +98,6 @@ def validate_deadline_not_past(deadline):
         return True
     
     if isinstance(deadline, str):
-        deadline = datetime.strptime(deadline, '%Y-%m-%d').date()
+        deadline = date.fromisoformat(deadline)
     
     return deadline >= date.today()
@@ -0,0 +1,39 @@
+"""
+Gunicorn configuration for production deployment.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import os
+
+# Bind to the port provided by the platform (Render/Railway set PORT)
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Each process serves many requests concurrently on greenlets; the gevent
+# worker monkey-patches the stdlib so database I/O yields
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# A gevent worker already multiplexes worker_connections greenlets, so one
+# process per CPU is enough; 2 * CPU + 1 is the guideline for sync workers.
+# Extra processes only multiply database pools and per-process caches
+_cpus = os.cpu_count() or 1
+workers = int(os.getenv(
+    'WEB_CONCURRENCY',
+    _cpus if worker_class == 'gevent' else 2 * _cpus + 1
+))
+
+# Workers are forked after this file runs; ProductionConfig splits the
+# database connection budget across this many processes
+os.environ['WEB_CONCURRENCY'] = str(workers)
+
+# Recycle workers periodically to bound memory growth
+max_requests = 1000
+max_requests_jitter = 100
+
+timeout = 30
+keepalive = 5
+
+# Log to stdout/stderr for the platform's log collector
+accesslog = '-'
+errorlog = '-'
@@ -1,11 +1,18 @@
 """
 Database Reset Script
 Deletes all data from the database or recreates tables from scratch.
+
+Usage:
+    python reset_database.py                      (interactive menu)
+    python reset_database.py --mode clear --yes   (non-interactive, e.g. CI)
 """
+import argparse
 import os
 import sys
+from sqlalchemy import delete, text
 from app import create_app, db
 from app.models import Employee, Task
+from app.utils.caching import invalidate_lists
 
 
 class Colors:
@@ -19,24 +26,42 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Plain output when piped or logged (CI, cron)
+if not sys.stdout.isatty():
+    for _name in ('GREEN', 'RED', 'YELLOW', 'BLUE', 'CYAN', 'RESET', 'BOLD'):
+        setattr(Colors, _name, '')
+
+
 def clear_all_data():
     """Delete all data from tables but keep table structure"""
     try:
         print(f"\n{Colors.YELLOW}⚠️  Clearing all data from database...{Colors.RESET}")
         
-        # Delete all tasks first (due to foreign key constraint)
-        task_count = Task.query.count()
-        Task.query.delete()
-        print(f"{Colors.BLUE}  Deleted {task_count} tasks{Colors.RESET}")
-        
-        # Delete all employees
-        employee_count = Employee.query.count()
-        Employee.query.delete()
-        print(f"{Colors.BLUE}  Deleted {employee_count} employees{Colors.RESET}")
+        if db.engine.dialect.name == 'postgresql':
+            # One statement empties both tables and resets the ID sequences
+            db.session.execute(text('TRUNCATE TABLE tasks, employees RESTART IDENTITY CASCADE'))
+            print(f"{Colors.BLUE}  Truncated tasks and employees{Colors.RESET}")
+        else:
+            # Delete all tasks first (due to foreign key constraint); the script
+            # exits afterwards, so skip syncing the session and use rowcount
+            # instead of counting beforehand
+            deleted = db.session.execute(
+                delete(Task).execution_options(synchronize_session=False)
+            )
+            print(f"{Colors.BLUE}  Deleted {deleted.rowcount} tasks{Colors.RESET}")
+            
+            # Delete all employees
+            deleted = db.session.execute(
+                delete(Employee).execution_options(synchronize_session=False)
+            )
+            print(f"{Colors.BLUE}  Deleted {deleted.rowcount} employees{Colors.RESET}")
         
         # Commit changes
         db.session.commit()
         
+        # Cached list pages (shared through Redis) would still show the old rows
+        invalidate_lists()
+        
         print(f"{Colors.GREEN}✅ All data cleared successfully!{Colors.RESET}\n")
         return True
         
@@ -50,6 +75,9 @@ def recreate_tables():
     """Drop all tables and recreate them (complete reset)"""
     try:
         print(f"\n{Colors.YELLOW}⚠️  Dropping all tables...{Colors.RESET}")
+        # drop_all() runs on its own engine connection; release the one the
+        # session holds first (the SQLite writer pool only has one)
+        db.session.remove()
         db.drop_all()
         print(f"{Colors.BLUE}  All tables dropped{Colors.RESET}")
         
@@ -57,6 +85,9 @@ def recreate_tables():
         db.create_all()
         print(f"{Colors.BLUE}  All tables created{Colors.RESET}")
         
+        # Cached list pages (shared through Redis) would still show the old rows
+        invalidate_lists()
+        
         print(f"{Colors.GREEN}✅ Database recreated successfully!{Colors.RESET}\n")
         return True
         
@@ -82,8 +113,61 @@ def show_database_info():
         print(f"{Colors.RED}❌ Error reading database: {str(e)}{Colors.RESET}\n")
 
 
-def main():
-    """Main function"""
+def parse_args(argv=None):
+    """Parse command line options; without --mode the interactive menu is shown"""
+    parser = argparse.ArgumentParser(description='Reset the Employee-Task database.')
+    parser.add_argument(
+        '--mode',
+        choices=['clear', 'recreate', 'info'],
+        help='clear data, recreate tables, or only show info (skips the menu)'
+    )
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='do not ask for confirmation'
+    )
+    parser.add_argument(
+        '--config',
+        default=os.getenv('FLASK_ENV', 'development'),
+        choices=['development', 'production', 'testing'],
+        help='configuration to load (default: FLASK_ENV or development)'
+    )
+    return parser.parse_args(argv)
+
+
+def confirm(message, assume_yes):
+    """Ask for a yes/no confirmation unless --yes was given"""
+    if assume_yes:
+        return True
+    
+    answer = input(f"{Colors.RED}⚠️  {message} Continue? (yes/no): {Colors.RESET}").strip().lower()
+    return answer == 'yes'
+
+
+def choose_mode():
+    """Show the interactive menu and return the chosen mode ('exit', or None if invalid)"""
+    print(f"{Colors.BOLD}Choose an option:{Colors.RESET}")
+    print(f"  1. Clear all data (keep tables)")
+    print(f"  2. Recreate tables (complete reset)")
+    print(f"  3. Show info only (no changes)")
+    print(f"  4. Exit")
+    
+    choice = input(f"\n{Colors.YELLOW}Enter your choice (1-4): {Colors.RESET}").strip()
+    
+    if choice == '4':
+        print(f"{Colors.CYAN}Goodbye!{Colors.RESET}\n")
+        return 'exit'
+    
+    mode = {'1': 'clear', '2': 'recreate', '3': 'info'}.get(choice)
+    if mode is None:
+        print(f"{Colors.RED}Invalid choice.{Colors.RESET}\n")
+    return mode
+
+
+def main(argv=None):
+    """Main function; returns the process exit code"""
+    args = parse_args(argv)
+    
     print(f"\n{Colors.BOLD}{Colors.CYAN}")
     print("╔═══════════════════════════════════════════════════════════════════╗")
     print("║              Database Reset Utility                               ║")
@@ -92,56 +176,48 @@ def main():
     print(f"{Colors.RESET}")
     
     # Create app context
-    app = create_app()
+    app = create_app(args.config)
     
     with app.app_context():
         # Show current status
         print(f"{Colors.BOLD}Current Database Status:{Colors.RESET}")
         show_database_info()
         
-        # Ask user what to do
-        print(f"{Colors.BOLD}Choose an option:{Colors.RESET}")
-        print(f"  1. Clear all data (keep tables)")
-        print(f"  2. Recreate tables (complete reset)")
-        print(f"  3. Show info only (no changes)")
-        print(f"  4. Exit")
+        mode = args.mode or choose_mode()
         
-        choice = input(f"\n{Colors.YELLOW}Enter your choice (1-4): {Colors.RESET}").strip()
+        if mode is None:
+            return 1
         
-        if choice == '1':
-            # Confirm
-            confirm = input(f"{Colors.RED}⚠️  This will delete ALL data. Continue? (yes/no): {Colors.RESET}").strip().lower()
-            if confirm == 'yes':
-                if clear_all_data():
-                    show_database_info()
-            else:
-                print(f"{Colors.YELLOW}Operation cancelled.{Colors.RESET}\n")
-                
-        elif choice == '2':
-            # Confirm
-            confirm = input(f"{Colors.RED}⚠️  This will DROP and RECREATE all tables. Continue? (yes/no): {Colors.RESET}").strip().lower()
-            if confirm == 'yes':
-                if recreate_tables():
-                    show_database_info()
-            else:
+        if mode == 'clear':
+            if not confirm('This will delete ALL data.', args.yes):
                 print(f"{Colors.YELLOW}Operation cancelled.{Colors.RESET}\n")
-                
-        elif choice == '3':
-            print(f"{Colors.GREEN}No changes made.{Colors.RESET}\n")
+                return 1
+            if not clear_all_data():
+                return 1
+            show_database_info()
             
-        elif choice == '4':
-            print(f"{Colors.CYAN}Goodbye!{Colors.RESET}\n")
+        elif mode == 'recreate':
+            if not confirm('This will DROP and RECREATE all tables.', args.yes):
+                print(f"{Colors.YELLOW}Operation cancelled.{Colors.RESET}\n")
+                return 1
+            if not recreate_tables():
+                return 1
+            show_database_info()
             
-        else:
-            print(f"{Colors.RED}Invalid choice.{Colors.RESET}\n")
+        elif mode == 'info':
+            print(f"{Colors.GREEN}No changes made.{Colors.RESET}\n")
+    
+    return 0
 
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}⚠️  Operation cancelled by user{Colors.RESET}\n")
+        sys.exit(130)
     except Exception as e:
         print(f"\n{Colors.RED}❌ Fatal Error: {str(e)}{Colors.RESET}\n")
         import traceback
         traceback.print_exc()
+        sys.exit(1)
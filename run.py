@@ -4,6 +4,8 @@ Run this file to start the Flask development server.
 
 Usage:
     python run.py
+
+Development only; production runs under Gunicorn (see wsgi.py).
 """
 import os
 from app import create_app
@@ -31,15 +33,18 @@ if __name__ == '__main__':
     print("Available endpoints:")
     print("  - GET    /api/employees")
     print("  - POST   /api/employees")
+    print("  - POST   /api/employees/bulk")
     print("  - GET    /api/employees/<id>")
     print("  - PUT    /api/employees/<id>")
     print("  - DELETE /api/employees/<id>")
     print("  - GET    /api/employees/<id>/tasks")
     print("  - GET    /api/tasks")
     print("  - POST   /api/tasks")
+    print("  - POST   /api/tasks/bulk")
     print("  - GET    /api/tasks/<id>")
     print("  - PUT    /api/tasks/<id>")
     print("  - DELETE /api/tasks/<id>")
+    print("  - POST   /api/batch")
     print(f"{'='*60}\n")
     
     app.run(host=host, port=port, debug=debug)
@@ -2,9 +2,17 @@
 Manual API Testing Script with Debug Output
 Tests all endpoints with comprehensive error reporting.
 """
+import argparse
 import requests
 import json
-from datetime import datetime, timedelta
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from datetime import date, timedelta
 
 
 class Colors:
@@ -19,40 +27,146 @@ class Colors:
     BOLD = '\033[1m'
 
 
+HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# Plain output when piped or logged (CI)
+if not sys.stdout.isatty():
+    for _name in ('GREEN', 'RED', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'RESET', 'BOLD'):
+        setattr(Colors, _name, '')
+
+
+class FlaskAppAdapter(BaseAdapter):
+    """requests transport that answers from the Flask app in-process (no socket)"""
+    
+    def __init__(self, app):
+        super().__init__()
+        self.client = app.test_client()
+        # The in-memory test database lives on one connection; serve one request at a time
+        self._lock = threading.Lock()
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        # Skip Flask-Compress: the body is handed over as-is, never decoded
+        headers = {k: v for k, v in request.headers.items() if k.lower() != "accept-encoding"}
+        
+        with self._lock:
+            result = self.client.open(
+                url.path, method=request.method, query_string=url.query,
+                data=request.body, headers=headers
+            )
+        
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.headers = CaseInsensitiveDict(result.headers)
+        response._content = result.get_data()
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        pass
+
+
 class APITester:
     """API Testing class with comprehensive error reporting"""
     
-    def __init__(self, base_url="http://localhost:5000"):
+    def __init__(self, base_url="http://localhost:5000", verbose=False, mock=False):
         self.base_url = base_url
+        self.verbose = verbose
+        self.mock = mock
         self.test_count = 0
         self.passed_count = 0
         self.failed_count = 0
         self.created_employee_ids = []
         self.created_task_ids = []
+        
+        # Tests waiting to be sent together by flush()
+        self._queue = []
+        
+        # Output lines written in one call per test instead of per line
+        self._buf = []
+        
+        # (test name, request time in ns) for the slowest-tests report
+        self._latencies = []
+        
+        # Encoded request bodies by id(); each entry keeps its dict alive so
+        # the id cannot be reused (e.g. employee1_data is sent twice)
+        self._body_cache = {}
+        
+        # One pooled keep-alive session for every test instead of a new
+        # connection per request
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        
+        if mock:
+            # Serve every request from a fresh in-memory app instead of a live server
+            from app import create_app
+            self.session.mount(base_url, FlaskAppAdapter(create_app("testing")))
+    
+    def close(self):
+        """Write pending output and close the pooled HTTP session"""
+        self._write_output()
+        self.session.close()
+    
+    def _out(self, line=""):
+        """Buffer one line of output"""
+        self._buf.append(line)
+    
+    def _write_output(self):
+        """Write the buffered output with a single write"""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            sys.stdout.flush()
+            self._buf.clear()
     
     def log_info(self, message):
         """Print info message"""
-        print(f"{Colors.BLUE}ℹ️  {message}{Colors.RESET}")
+        self._out(f"{Colors.BLUE}ℹ️  {message}{Colors.RESET}")
     
     def log_success(self, message):
         """Print success message"""
-        print(f"{Colors.GREEN}✅ {message}{Colors.RESET}")
+        self._out(f"{Colors.GREEN}✅ {message}{Colors.RESET}")
     
     def log_error(self, message):
         """Print error message"""
-        print(f"{Colors.RED}❌ {message}{Colors.RESET}")
+        self._out(f"{Colors.RED}❌ {message}{Colors.RESET}")
     
     def log_warning(self, message):
         """Print warning message"""
-        print(f"{Colors.YELLOW}⚠️  {message}{Colors.RESET}")
+        self._out(f"{Colors.YELLOW}⚠️  {message}{Colors.RESET}")
     
     def log_section(self, title):
         """Print section header"""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}")
-        print(f"  {title}")
-        print(f"{'='*70}{Colors.RESET}\n")
+        self._out(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}")
+        self._out(f"  {title}")
+        self._out(f"{'='*70}{Colors.RESET}\n")
+        self._write_output()
+    
+    def _encode(self, data):
+        """Return the JSON bytes for a request body, encoding it only once"""
+        if data is None:
+            return None
+        
+        cached = self._body_cache.get(id(data))
+        if cached is None:
+            cached = (data, json.dumps(data).encode())
+            self._body_cache[id(data)] = cached
+        return cached[1]
+    
+    def _send(self, method, endpoint, data=None, params=None):
+        """Send a request on the shared session without any logging"""
+        start = time.perf_counter_ns()
+        response = self.session.request(
+            method, f"{self.base_url}{endpoint}", data=self._encode(data), params=params,
+            headers={"Content-Type": "application/json"}, timeout=10
+        )
+        # Timed here so concurrently sent tests report their own request time
+        response.latency_ns = time.perf_counter_ns() - start
+        return response
     
-    def make_request(self, method, endpoint, data=None, params=None):
+    def make_request(self, method, endpoint, data=None, params=None, future=None,
+                     parse_body=False):
         """
         Make HTTP request with error handling
         
@@ -61,63 +175,67 @@ class APITester:
             endpoint (str): API endpoint
             data (dict): Request body data
             params (dict): Query parameters
+            future (Future): Already submitted request to report on instead
+            parse_body (bool): Parse the body even when the request succeeded
             
         Returns:
-            tuple: (response object, success boolean, error message)
+            tuple: (response object, parsed response body or None, success boolean, error message)
         """
         url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
         
         try:
             self.log_info(f"Request: {method} {url}")
-            if data:
-                print(f"  Body: {json.dumps(data, indent=2)}")
+            if data and self.verbose:
+                self._out(f"  Body: {json.dumps(data, indent=2)}")
             if params:
-                print(f"  Params: {params}")
+                self._out(f"  Params: {params}")
+            
+            if method not in HTTP_METHODS:
+                return None, None, False, f"Invalid HTTP method: {method}"
             
-            if method == "GET":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-            elif method == "POST":
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            elif method == "PUT":
-                response = requests.put(url, json=data, headers=headers, timeout=10)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=10)
+            if future is not None:
+                response = future.result()
             else:
-                return None, False, f"Invalid HTTP method: {method}"
+                response = self._send(method, endpoint, data, params)
+            
+            self._out(f"  Status: {response.status_code}")
             
-            print(f"  Status: {response.status_code}")
+            succeeded = 200 <= response.status_code < 300
             
-            # Try to parse JSON response
-            try:
-                response_data = response.json()
-                print(f"  Response: {json.dumps(response_data, indent=2)}")
-            except json.JSONDecodeError:
-                print(f"  Response: {response.text}")
-                response_data = {"error": "Invalid JSON response"}
+            # Parse the JSON response once, and only when something reads it:
+            # the caller, the verbose print or the error message of a failure
+            response_data = None
+            if parse_body or self.verbose or not succeeded:
+                try:
+                    response_data = response.json()
+                    if self.verbose:
+                        self._out(f"  Response: {json.dumps(response_data, indent=2)}")
+                except json.JSONDecodeError:
+                    self._out(f"  Response: {response.text}")
+                    response_data = {"error": "Invalid JSON response"}
             
             # Check if request was successful
-            if 200 <= response.status_code < 300:
-                return response, True, None
+            if succeeded:
+                return response, response_data, True, None
             else:
                 error_msg = response_data.get('message', 'Unknown error')
-                return response, False, error_msg
+                return response, response_data, False, error_msg
                 
         except requests.exceptions.ConnectionError as e:
             error_msg = f"Connection Error: Cannot connect to {url}. Is the server running?"
             self.log_error(error_msg)
-            return None, False, error_msg
+            return None, None, False, error_msg
         except requests.exceptions.Timeout as e:
             error_msg = f"Timeout Error: Request took too long"
             self.log_error(error_msg)
-            return None, False, error_msg
+            return None, None, False, error_msg
         except Exception as e:
             error_msg = f"Unexpected Error: {str(e)}"
             self.log_error(error_msg)
-            return None, False, error_msg
+            return None, None, False, error_msg
     
     def run_test(self, test_name, method, endpoint, data=None, params=None, 
-                 expected_status=200, should_fail=False):
+                 expected_status=200, should_fail=False, future=None, parse_body=False):
         """
         Run a single test
         
@@ -129,50 +247,191 @@ class APITester:
             params (dict): Query parameters
             expected_status (int): Expected status code
             should_fail (bool): Whether this test is expected to fail
+            future (Future): Already submitted request to check instead
+            parse_body (bool): Return the parsed body (e.g. to read a created ID)
             
         Returns:
-            response object if successful, None otherwise
+            parsed response body (with parse_body) or response object if
+            successful, None otherwise
         """
         self.test_count += 1
-        print(f"\n{Colors.BOLD}Test #{self.test_count}: {test_name}{Colors.RESET}")
-        print("-" * 70)
+        self._out(f"\n{Colors.BOLD}Test #{self.test_count}: {test_name}{Colors.RESET}")
+        self._out("-" * 70)
+        
+        response, response_data, success, error = self.make_request(
+            method, endpoint, data, params, future, parse_body
+        )
         
-        response, success, error = self.make_request(method, endpoint, data, params)
+        result = response_data if parse_body else response
+        if response is not None:
+            self._latencies.append((test_name, response.latency_ns))
         
         if response is None:
             self.failed_count += 1
             self.log_error(f"Test Failed: {error}")
-            return None
+            result = None
+        elif not self.check_status(response.status_code, expected_status, error):
+            result = None
         
-        # Check status code
-        if response.status_code == expected_status:
+        self._write_output()
+        return result
+    
+    def check_status(self, status_code, expected_status, error=None):
+        """
+        Count and log a test result by its status code
+        
+        Args:
+            status_code (int): Status code received
+            expected_status (int): Expected status code
+            error (str): Error message to show on failure
+            
+        Returns:
+            bool: Whether the test passed
+        """
+        if status_code == expected_status:
             self.passed_count += 1
-            self.log_success(f"Test Passed: Status {response.status_code} (Expected {expected_status})")
-            return response
+            self.log_success(f"Test Passed: Status {status_code} (Expected {expected_status})")
+            return True
         else:
             self.failed_count += 1
-            self.log_error(f"Test Failed: Status {response.status_code} (Expected {expected_status})")
+            self.log_error(f"Test Failed: Status {status_code} (Expected {expected_status})")
             if error:
                 self.log_error(f"Error Message: {error}")
-            return None
+            return False
+    
+    def run_tests_concurrently(self, tests, parse_body=False):
+        """
+        Run independent tests with their requests in flight at the same time
+        
+        Requests are sent from a thread pool; results are then checked and
+        logged one by one in the given order so output stays deterministic.
+        
+        Args:
+            tests (list): (test_name, method, endpoint, data, expected_status) tuples
+            parse_body (bool): Return parsed bodies instead of response objects
+            
+        Returns:
+            list: run_test result for each test, in the given order
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._send, method, endpoint, data)
+                for _, method, endpoint, data, _ in tests
+            ]
+            
+            return [
+                self.run_test(test_name, method, endpoint, data=data,
+                              expected_status=expected_status, future=future,
+                              parse_body=parse_body)
+                for (test_name, method, endpoint, data, expected_status), future
+                in zip(tests, futures)
+            ]
+    
+    def enqueue_test(self, test_name, method, endpoint, data=None, params=None,
+                     expected_status=200):
+        """
+        Queue an independent test to be sent with the next flush()
+        
+        Args:
+            test_name (str): Name of the test
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            data (dict): Request body
+            params (dict): Query parameters
+            expected_status (int): Expected status code
+        """
+        path = f"{endpoint}?{urlencode(params)}" if params else endpoint
+        self._queue.append({
+            "test_name": test_name,
+            "method": method,
+            "path": path,
+            "body": data,
+            "expected_status": expected_status
+        })
+    
+    def flush(self):
+        """
+        Send all queued tests in one POST /api/batch and check each result
+        
+        Returns:
+            list: {status, body} result or None for each queued test, in order
+        """
+        queue, self._queue = self._queue, []
+        if not queue:
+            return []
+        
+        self.log_info(f"Request: POST {self.base_url}/api/batch ({len(queue)} queued tests)")
+        batch = [
+            {"method": test["method"], "path": test["path"], "body": test["body"]}
+            for test in queue
+        ]
+        
+        results = [None] * len(queue)
+        error = None
+        try:
+            response = self._send("POST", "/api/batch", batch)
+            self._latencies.append((f"Batch of {len(queue)} tests", response.latency_ns))
+            if response.status_code == 200:
+                results = response.json()["data"]
+            else:
+                error = f"Batch request failed with status {response.status_code}"
+        except requests.exceptions.ConnectionError:
+            error = f"Connection Error: Cannot connect to {self.base_url}. Is the server running?"
+        except requests.exceptions.Timeout:
+            error = "Timeout Error: Request took too long"
+        except Exception as e:
+            error = f"Unexpected Error: {str(e)}"
+        
+        for test, result in zip(queue, results):
+            self.test_count += 1
+            self._out(f"\n{Colors.BOLD}Test #{self.test_count}: {test['test_name']}{Colors.RESET}")
+            self._out("-" * 70)
+            self.log_info(f"Batched: {test['method']} {self.base_url}{test['path']}")
+            
+            if result is None:
+                self.failed_count += 1
+                self.log_error(f"Test Failed: {error}")
+                continue
+            
+            body = result["body"] or {}
+            self._out(f"  Status: {result['status']}")
+            if self.verbose:
+                self._out(f"  Response: {json.dumps(body, indent=2)}")
+            self.check_status(result["status"], test["expected_status"],
+                              body.get("message", "Unknown error"))
+        
+        self._write_output()
+        return results
     
     def print_summary(self):
         """Print test summary"""
         self.log_section("TEST SUMMARY")
-        print(f"Total Tests: {self.test_count}")
-        print(f"{Colors.GREEN}Passed: {self.passed_count}{Colors.RESET}")
-        print(f"{Colors.RED}Failed: {self.failed_count}{Colors.RESET}")
+        self._out(f"Total Tests: {self.test_count}")
+        self._out(f"{Colors.GREEN}Passed: {self.passed_count}{Colors.RESET}")
+        self._out(f"{Colors.RED}Failed: {self.failed_count}{Colors.RESET}")
         
         if self.failed_count == 0:
             self.log_success("🎉 ALL TESTS PASSED!")
         else:
             self.log_error(f"❌ {self.failed_count} test(s) failed")
-        print()
+        
+        if self._latencies:
+            self._out(f"\n{Colors.BOLD}Slowest requests:{Colors.RESET}")
+            for name, elapsed_ns in sorted(self._latencies, key=lambda item: -item[1])[:5]:
+                self._out(f"  {elapsed_ns / 1e6:8.1f}ms  {name}")
+        self._out()
+        self._write_output()
 
 
-def main():
+def main(tester=None):
     """Main test execution"""
-    tester = APITester()
+    if tester is None:
+        tester = APITester()
+    
+    # Task deadlines, computed once for the whole run
+    today = date.today()
+    tomorrow = (today + timedelta(days=1)).isoformat()
+    next_week = (today + timedelta(days=7)).isoformat()
     
     print(f"\n{Colors.BOLD}{Colors.MAGENTA}")
     print("╔═══════════════════════════════════════════════════════════════════╗")
@@ -190,13 +449,15 @@ def main():
     )
     
     if response is None:
-        tester.log_error("Server is not running! Please start the server with: python run.py")
+        tester.log_error("Server is not running! Please start the server with: python run.py "
+                         "(or run this script with --mock)")
+        tester.close()
         return
     
     # Phase 1: Employee CRUD Operations
     tester.log_section("PHASE 1: EMPLOYEE CRUD OPERATIONS")
     
-    # Test 1: Create Employee 1
+    # Tests 1-3: Create Employees 1-3 (independent, sent concurrently)
     employee1_data = {
         "first_name": "Alice",
         "last_name": "Williams",
@@ -206,18 +467,6 @@ def main():
         "phone": "+919876543210",
         "hire_date": "2024-01-15"
     }
-    response = tester.run_test(
-        "Create Employee 1 (Alice)",
-        "POST", "/api/employees",
-        data=employee1_data,
-        expected_status=201
-    )
-    if response:
-        emp1_id = response.json()['data']['id']
-        tester.created_employee_ids.append(emp1_id)
-        tester.log_info(f"Created Employee ID: {emp1_id}")
-    
-    # Test 2: Create Employee 2
     employee2_data = {
         "first_name": "Michael",
         "last_name": "Chen",
@@ -227,18 +476,6 @@ def main():
         "phone": "+919876543211",
         "hire_date": "2024-03-20"
     }
-    response = tester.run_test(
-        "Create Employee 2 (Michael)",
-        "POST", "/api/employees",
-        data=employee2_data,
-        expected_status=201
-    )
-    if response:
-        emp2_id = response.json()['data']['id']
-        tester.created_employee_ids.append(emp2_id)
-        tester.log_info(f"Created Employee ID: {emp2_id}")
-    
-    # Test 3: Create Employee 3
     employee3_data = {
         "first_name": "Sarah",
         "last_name": "Martinez",
@@ -247,16 +484,16 @@ def main():
         "position": "DevOps Engineer",
         "hire_date": "2024-06-10"
     }
-    response = tester.run_test(
-        "Create Employee 3 (Sarah)",
-        "POST", "/api/employees",
-        data=employee3_data,
-        expected_status=201
-    )
-    if response:
-        emp3_id = response.json()['data']['id']
-        tester.created_employee_ids.append(emp3_id)
-        tester.log_info(f"Created Employee ID: {emp3_id}")
+    responses = tester.run_tests_concurrently([
+        ("Create Employee 1 (Alice)", "POST", "/api/employees", employee1_data, 201),
+        ("Create Employee 2 (Michael)", "POST", "/api/employees", employee2_data, 201),
+        ("Create Employee 3 (Sarah)", "POST", "/api/employees", employee3_data, 201)
+    ], parse_body=True)
+    for response_data in responses:
+        if response_data:
+            emp_id = response_data['data']['id']
+            tester.created_employee_ids.append(emp_id)
+            tester.log_info(f"Created Employee ID: {emp_id}")
     
     # Test 4: Duplicate Email (Should Fail)
     tester.run_test(
@@ -266,8 +503,22 @@ def main():
         expected_status=400
     )
     
+    # Test 8: Update Employee
+    if tester.created_employee_ids:
+        update_data = {
+            "position": "Lead Software Engineer",
+            "department": "Engineering - Backend Team"
+        }
+        tester.run_test(
+            f"Update Employee ({tester.created_employee_ids[0]})",
+            "PUT", f"/api/employees/{tester.created_employee_ids[0]}",
+            data=update_data,
+            expected_status=200
+        )
+    
+    # Tests 5-7, 9-10: Read-only checks, sent together in one batch request
     # Test 5: Get All Employees
-    tester.run_test(
+    tester.enqueue_test(
         "Get All Employees",
         "GET", "/api/employees",
         expected_status=200
@@ -275,34 +526,21 @@ def main():
     
     # Test 6: Get Single Employee
     if tester.created_employee_ids:
-        tester.run_test(
+        tester.enqueue_test(
             f"Get Employee by ID ({tester.created_employee_ids[0]})",
             "GET", f"/api/employees/{tester.created_employee_ids[0]}",
             expected_status=200
         )
     
     # Test 7: Get Non-existent Employee
-    tester.run_test(
+    tester.enqueue_test(
         "Get Non-existent Employee (Should Fail)",
         "GET", "/api/employees/99999",
         expected_status=404
     )
     
-    # Test 8: Update Employee
-    if tester.created_employee_ids:
-        update_data = {
-            "position": "Lead Software Engineer",
-            "department": "Engineering - Backend Team"
-        }
-        tester.run_test(
-            f"Update Employee ({tester.created_employee_ids[0]})",
-            "PUT", f"/api/employees/{tester.created_employee_ids[0]}",
-            data=update_data,
-            expected_status=200
-        )
-    
     # Test 9: Filter by Department
-    tester.run_test(
+    tester.enqueue_test(
         "Filter Employees by Department (Engineering)",
         "GET", "/api/employees",
         params={"department": "Engineering"},
@@ -310,19 +548,20 @@ def main():
     )
     
     # Test 10: Pagination
-    tester.run_test(
+    tester.enqueue_test(
         "Get Employees with Pagination (page=1, per_page=2)",
         "GET", "/api/employees",
         params={"page": 1, "per_page": 2},
         expected_status=200
     )
+    tester.flush()
     
     # Phase 2: Task CRUD Operations
     tester.log_section("PHASE 2: TASK CRUD OPERATIONS")
     
-    # Test 11: Create Task 1
+    # Tests 11-13: Create Tasks 1-3 (independent, sent concurrently)
+    task_tests = []
     if tester.created_employee_ids:
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
         task1_data = {
             "title": "Implement User Authentication",
             "description": "Add JWT-based authentication to the API",
@@ -331,20 +570,9 @@ def main():
             "employee_id": tester.created_employee_ids[0],
             "deadline": tomorrow
         }
-        response = tester.run_test(
-            "Create Task 1 (Assigned to Alice)",
-            "POST", "/api/tasks",
-            data=task1_data,
-            expected_status=201
-        )
-        if response:
-            task1_id = response.json()['data']['id']
-            tester.created_task_ids.append(task1_id)
-            tester.log_info(f"Created Task ID: {task1_id}")
+        task_tests.append(("Create Task 1 (Assigned to Alice)", "POST", "/api/tasks", task1_data, 201))
     
-    # Test 12: Create Task 2
     if len(tester.created_employee_ids) >= 2:
-        next_week = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
         task2_data = {
             "title": "Product Roadmap Planning",
             "description": "Create Q1 2026 product roadmap",
@@ -353,34 +581,21 @@ def main():
             "employee_id": tester.created_employee_ids[1],
             "deadline": next_week
         }
-        response = tester.run_test(
-            "Create Task 2 (Assigned to Michael)",
-            "POST", "/api/tasks",
-            data=task2_data,
-            expected_status=201
-        )
-        if response:
-            task2_id = response.json()['data']['id']
-            tester.created_task_ids.append(task2_id)
-            tester.log_info(f"Created Task ID: {task2_id}")
+        task_tests.append(("Create Task 2 (Assigned to Michael)", "POST", "/api/tasks", task2_data, 201))
     
-    # Test 13: Create Unassigned Task
     task3_data = {
         "title": "Code Review for PR #123",
         "description": "Review pull request from team member",
         "status": "pending",
         "priority": "low"
     }
-    response = tester.run_test(
-        "Create Task 3 (Unassigned)",
-        "POST", "/api/tasks",
-        data=task3_data,
-        expected_status=201
-    )
-    if response:
-        task3_id = response.json()['data']['id']
-        tester.created_task_ids.append(task3_id)
-        tester.log_info(f"Created Task ID: {task3_id}")
+    task_tests.append(("Create Task 3 (Unassigned)", "POST", "/api/tasks", task3_data, 201))
+    
+    for response_data in tester.run_tests_concurrently(task_tests, parse_body=True):
+        if response_data:
+            task_id = response_data['data']['id']
+            tester.created_task_ids.append(task_id)
+            tester.log_info(f"Created Task ID: {task_id}")
     
     # Test 14: Create Task with Invalid Employee
     invalid_task_data = {
@@ -395,21 +610,6 @@ def main():
         expected_status=400
     )
     
-    # Test 15: Get All Tasks
-    tester.run_test(
-        "Get All Tasks",
-        "GET", "/api/tasks",
-        expected_status=200
-    )
-    
-    # Test 16: Get Single Task
-    if tester.created_task_ids:
-        tester.run_test(
-            f"Get Task by ID ({tester.created_task_ids[0]})",
-            "GET", f"/api/tasks/{tester.created_task_ids[0]}",
-            expected_status=200
-        )
-    
     # Test 17: Update Task
     if tester.created_task_ids:
         update_task_data = {
@@ -423,8 +623,24 @@ def main():
             expected_status=200
         )
     
+    # Tests 15-16, 18-19: Read-only checks, sent together in one batch request
+    # Test 15: Get All Tasks
+    tester.enqueue_test(
+        "Get All Tasks",
+        "GET", "/api/tasks",
+        expected_status=200
+    )
+    
+    # Test 16: Get Single Task
+    if tester.created_task_ids:
+        tester.enqueue_test(
+            f"Get Task by ID ({tester.created_task_ids[0]})",
+            "GET", f"/api/tasks/{tester.created_task_ids[0]}",
+            expected_status=200
+        )
+    
     # Test 18: Filter Tasks by Status
-    tester.run_test(
+    tester.enqueue_test(
         "Filter Tasks by Status (pending)",
         "GET", "/api/tasks",
         params={"status": "pending"},
@@ -432,12 +648,13 @@ def main():
     )
     
     # Test 19: Filter Tasks by Priority
-    tester.run_test(
+    tester.enqueue_test(
         "Filter Tasks by Priority (high)",
         "GET", "/api/tasks",
         params={"priority": "high"},
         expected_status=200
     )
+    tester.flush()
     
     # Phase 3: Relationship Operations
     tester.log_section("PHASE 3: RELATIONSHIP OPERATIONS")
@@ -453,38 +670,31 @@ def main():
     # Phase 4: Delete Operations
     tester.log_section("PHASE 4: DELETE OPERATIONS")
     
-    # Test 21: Delete Task
+    # Tests 21-23: Deletes of unrelated rows (independent, sent concurrently)
+    delete_tests = []
     if tester.created_task_ids and len(tester.created_task_ids) >= 3:
-        tester.run_test(
-            f"Delete Task ({tester.created_task_ids[2]})",
-            "DELETE", f"/api/tasks/{tester.created_task_ids[2]}",
-            expected_status=200
-        )
+        delete_tests.append((f"Delete Task ({tester.created_task_ids[2]})",
+                             "DELETE", f"/api/tasks/{tester.created_task_ids[2]}", None, 200))
     
-    # Test 22: Delete Non-existent Task
-    tester.run_test(
-        "Delete Non-existent Task (Should Fail)",
-        "DELETE", "/api/tasks/99999",
-        expected_status=404
-    )
+    delete_tests.append(("Delete Non-existent Task (Should Fail)",
+                         "DELETE", "/api/tasks/99999", None, 404))
     
-    # Test 23: Delete Employee
     if tester.created_employee_ids and len(tester.created_employee_ids) >= 3:
-        tester.run_test(
-            f"Delete Employee ({tester.created_employee_ids[2]})",
-            "DELETE", f"/api/employees/{tester.created_employee_ids[2]}",
-            expected_status=200
-        )
+        delete_tests.append((f"Delete Employee ({tester.created_employee_ids[2]})",
+                             "DELETE", f"/api/employees/{tester.created_employee_ids[2]}", None, 200))
+    
+    tester.run_tests_concurrently(delete_tests)
     
     # Phase 5: Validation Tests
     tester.log_section("PHASE 5: VALIDATION TESTS")
     
+    # Tests 24-25: Independent validation checks, sent together in one batch request
     # Test 24: Create Employee with Missing Fields
     invalid_employee = {
         "first_name": "Test"
         # Missing required fields
     }
-    tester.run_test(
+    tester.enqueue_test(
         "Create Employee with Missing Fields (Should Fail)",
         "POST", "/api/employees",
         data=invalid_employee,
@@ -496,21 +706,32 @@ def main():
         "title": "Test Task",
         "status": "invalid_status"
     }
-    tester.run_test(
+    tester.enqueue_test(
         "Create Task with Invalid Status (Should Fail)",
         "POST", "/api/tasks",
         data=invalid_task,
         expected_status=400
     )
+    tester.flush()
     
     # Print final summary
     tester.print_summary()
+    tester.close()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the manual API test suite")
+    parser.add_argument("--verbose", action="store_true",
+                        help="print request and response bodies")
+    parser.add_argument("--mock", action="store_true",
+                        help="run against the app in-process on an in-memory database (no server)")
+    args = parser.parse_args()
+    
+    tester = APITester(verbose=args.verbose, mock=args.mock)
     try:
-        main()
+        main(tester)
     except KeyboardInterrupt:
+        tester.close()
         print(f"\n\n{Colors.YELLOW}⚠️  Tests interrupted by user{Colors.RESET}")
     except Exception as e:
         print(f"\n\n{Colors.RED}❌ Fatal Error: {str(e)}{Colors.RESET}")
@@ -2,7 +2,9 @@
 Pytest configuration and fixtures for testing.
 """
 import pytest
-from app import create_app, db
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from app import cache, create_app, db
 from app.models import Employee, Task
 
 
@@ -19,18 +21,55 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture(scope='function')
-def init_database(app):
-    """Initialize database for each test."""
+@pytest.fixture(scope='session')
+def database(app):
+    """Create the schema once for the whole test session."""
     with app.app_context():
-        # Create tables
+        engine = db.engine
+        
+        # pysqlite starts transactions lazily and breaks SAVEPOINT; take over
+        # BEGIN so each test's writes can be rolled back as a nested transaction
+        @event.listens_for(engine, 'connect')
+        def disable_implicit_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+        
+        @event.listens_for(engine, 'begin')
+        def emit_begin(connection):
+            connection.exec_driver_sql('BEGIN')
+        
+        # Reopen the shared in-memory connection so the listeners apply to it
+        engine.dispose()
         db.create_all()
         
         yield db
         
+        db.drop_all()
+
+
+@pytest.fixture(scope='function')
+def init_database(app, database):
+    """Run each test in a transaction that is rolled back afterwards."""
+    with app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        
+        # Commits inside the test (and its requests) only release SAVEPOINTs
+        app_session = db.session
+        db.session = scoped_session(sessionmaker(
+            bind=connection,
+            join_transaction_mode='create_savepoint'
+        ))
+        
+        # Cached list pages would outlive the rolled back rows
+        cache.clear()
+        
+        yield db
+        
         # Clean up after test
         db.session.remove()
-        db.drop_all()
+        db.session = app_session
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
@@ -48,6 +87,24 @@ def sample_employee(init_database):
     return employee
 
 
+@pytest.fixture
+def bulk_employees(init_database):
+    """Create 25 employees in one bulk insert for pagination tests."""
+    employees = [
+        Employee(
+            first_name="Bulk",
+            last_name=f"User{i}",
+            email=f"bulk{i}@example.com",
+            department="Engineering",
+            position="Software Engineer"
+        )
+        for i in range(25)
+    ]
+    db.session.bulk_save_objects(employees)
+    db.session.commit()
+    return employees
+
+
 @pytest.fixture
 def sample_task(init_database, sample_employee):
     """Create a sample task for testing."""
@@ -0,0 +1,72 @@
+"""
+Test cases for the batch API endpoint.
+"""
+import json
+
+
+def test_batch_runs_sub_requests_in_order(client, sample_employee):
+    """Test a batch returns each sub-request's status and body in order."""
+    batch = [
+        {'method': 'GET', 'path': f'/api/employees/{sample_employee.id}'},
+        {'method': 'GET', 'path': '/api/employees/99999'},
+        {'method': 'POST', 'path': '/api/tasks', 'body': {
+            'title': 'Batched Task',
+            'employee_id': sample_employee.id
+        }},
+        {'method': 'GET', 'path': '/api/tasks?status=pending'}
+    ]
+    response = client.post('/api/batch',
+                          data=json.dumps(batch),
+                          content_type='application/json')
+    assert response.status_code == 200
+    results = json.loads(response.data)['data']
+    
+    assert [result['status'] for result in results] == [200, 404, 201, 200]
+    assert results[0]['body']['data']['email'] == 'test@example.com'
+    assert results[2]['body']['data']['title'] == 'Batched Task'
+    
+    # The list read runs after the create in the same batch
+    assert [task['title'] for task in results[3]['body']['data']] == ['Batched Task']
+
+
+def test_batch_failure_does_not_stop_batch(client, init_database):
+    """Test a failing sub-request is reported while later ones still run."""
+    batch = [
+        {'method': 'POST', 'path': '/api/tasks', 'body': {'title': 'Bad', 'status': 'invalid_status'}},
+        {'method': 'POST', 'path': '/api/tasks', 'body': {'title': 'Good'}}
+    ]
+    response = client.post('/api/batch',
+                          data=json.dumps(batch),
+                          content_type='application/json')
+    assert response.status_code == 200
+    results = json.loads(response.data)['data']
+    assert results[0]['status'] == 400
+    assert 'status' in results[0]['body']['errors']
+    assert results[1]['status'] == 201
+
+
+def test_batch_rejects_invalid_requests(client, init_database):
+    """Test malformed, nested or oversized batches are rejected."""
+    for batch in (
+        [],
+        {'method': 'GET', 'path': '/api/tasks'},
+        [{'method': 'PATCH', 'path': '/api/tasks'}],
+        [{'method': 'GET', 'path': '/health'}],
+        [{'method': 'POST', 'path': '/api/batch', 'body': []}],
+        [{'method': 'POST', 'path': '/api/batch#x', 'body': []}],
+        [{'method': 'POST', 'path': '/api/%62atch', 'body': []}],
+        [{'method': 'GET', 'path': '/api/tasks'}] * 51
+    ):
+        response = client.post('/api/batch',
+                              data=json.dumps(batch),
+                              content_type='application/json')
+        assert response.status_code == 400
+
+
+def test_batch_refuses_to_run_as_sub_request(client, init_database):
+    """Test a batch dispatched from inside another batch is refused."""
+    response = client.post('/api/batch',
+                          data=json.dumps([{'method': 'GET', 'path': '/api/tasks'}]),
+                          content_type='application/json',
+                          environ_base={'employee_task_api.batch': True})
+    assert response.status_code == 400
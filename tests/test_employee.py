@@ -110,10 +110,223 @@ def test_filter_employees_by_department(client, sample_employee):
     assert len(data['data']) >= 1
 
 
-def test_pagination(client, init_database):
+def test_pagination(client, bulk_employees):
     """Test employee pagination."""
-    response = client.get('/api/employees?page=1&per_page=5')
+    response = client.get('/api/employees?page=1&per_page=5&with_total=1')
     assert response.status_code == 200
     data = json.loads(response.data)
     assert 'pagination' in data
     assert data['pagination']['page'] == 1
+    assert data['pagination']['total'] == 25
+    assert data['pagination']['pages'] == 5
+    assert len(data['data']) == 5
+
+
+def test_get_all_employees_includes_tasks(client, sample_task):
+    """Test employee list embeds tasks without lazy loading per row."""
+    response = client.get('/api/employees')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['data'][0]['tasks'][0]['id'] == sample_task.id
+
+
+def test_keyset_pagination(client, init_database):
+    """Test employee keyset pagination with after_id."""
+    for i in range(3):
+        client.post('/api/employees',
+                    data=json.dumps({
+                        'first_name': 'Page',
+                        'last_name': f'User{i}',
+                        'email': f'page{i}@test.com'
+                    }),
+                    content_type='application/json')
+    
+    response = client.get('/api/employees?after_id=0&per_page=2')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert len(data['data']) == 2
+    assert data['pagination']['has_next'] is True
+    
+    next_after_id = data['pagination']['next_after_id']
+    response = client.get(f'/api/employees?after_id={next_after_id}&per_page=2')
+    data = json.loads(response.data)
+    assert len(data['data']) == 1
+    assert data['pagination']['has_next'] is False
+
+
+def test_employee_dates_serialized_as_iso(client, init_database):
+    """Test date and datetime fields are returned as ISO 8601 strings."""
+    employee_data = {
+        'first_name': 'Date',
+        'last_name': 'Check',
+        'email': 'date.check@test.com',
+        'hire_date': '2024-01-15'
+    }
+    response = client.post('/api/employees',
+                          data=json.dumps(employee_data),
+                          content_type='application/json')
+    assert response.status_code == 201
+    data = json.loads(response.data)
+    assert data['data']['hire_date'] == '2024-01-15'
+    assert data['data']['created_at'].endswith('+00:00')
+
+
+def test_list_response_is_compressed(client, init_database):
+    """Test large JSON list responses are gzip-compressed when accepted."""
+    for i in range(8):
+        client.post('/api/employees',
+                    data=json.dumps({
+                        'first_name': 'Compressed',
+                        'last_name': f'User{i}',
+                        'email': f'compressed{i}@test.com',
+                        'department': 'Engineering'
+                    }),
+                    content_type='application/json')
+    
+    response = client.get('/api/employees', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+
+
+def test_get_employee_etag_tracks_tasks(client, sample_task):
+    """Test the employee ETag changes when one of its tasks changes."""
+    employee_id = sample_task.employee_id
+    response = client.get(f'/api/employees/{employee_id}')
+    etag = response.headers['ETag']
+    
+    response = client.get(f'/api/employees/{employee_id}',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    
+    client.put(f'/api/tasks/{sample_task.id}',
+               data=json.dumps({'priority': 'low'}),
+               content_type='application/json')
+    response = client.get(f'/api/employees/{employee_id}',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_bulk_create_employees(client, init_database):
+    """Test creating several employees in one request."""
+    employees = [
+        {
+            'first_name': 'Bulk',
+            'last_name': f'User{i}',
+            'email': f'bulk{i}@test.com'
+        }
+        for i in range(3)
+    ]
+    response = client.post('/api/employees/bulk',
+                          data=json.dumps(employees),
+                          content_type='application/json')
+    assert response.status_code == 201
+    data = json.loads(response.data)
+    assert data['count'] == 3
+    
+    response = client.get('/api/employees')
+    assert len(json.loads(response.data)['data']) == 3
+
+
+def test_bulk_create_employees_duplicate_email(client, sample_employee):
+    """Test a duplicate email rejects the whole batch."""
+    employees = [
+        {'first_name': 'New', 'last_name': 'User', 'email': 'new@test.com'},
+        {'first_name': 'Dup', 'last_name': 'User', 'email': sample_employee.email}
+    ]
+    response = client.post('/api/employees/bulk',
+                          data=json.dumps(employees),
+                          content_type='application/json')
+    assert response.status_code == 400
+    
+    response = client.get('/api/employees')
+    assert len(json.loads(response.data)['data']) == 1
+
+
+def test_create_employee_invalid_email(client, init_database):
+    """Test creating employee with a malformed email fails."""
+    employee_data = {
+        'first_name': 'Bad',
+        'last_name': 'Email',
+        'email': 'not-an-email'
+    }
+    response = client.post('/api/employees',
+                          data=json.dumps(employee_data),
+                          content_type='application/json')
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data['errors']['email'] == ['Invalid email format']
+
+
+def test_create_employee_email_trailing_newline(client, init_database):
+    """Test an email with a trailing newline is rejected, not stored."""
+    employee_data = {
+        'first_name': 'Bad',
+        'last_name': 'Newline',
+        'email': 'a@b.co\n'
+    }
+    response = client.post('/api/employees',
+                          data=json.dumps(employee_data),
+                          content_type='application/json')
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data['errors']['email'] == ['Invalid email format']
+
+
+def test_pagination_total_opt_in(client, sample_employee):
+    """Test total/pages are only returned when with_total=1."""
+    response = client.get('/api/employees?per_page=5')
+    pagination = json.loads(response.data)['pagination']
+    assert 'total' not in pagination
+    assert pagination['has_next'] is False
+    
+    response = client.get('/api/employees?per_page=5&with_total=1')
+    pagination = json.loads(response.data)['pagination']
+    assert pagination['total'] == 1
+    assert pagination['pages'] == 1
+
+
+def test_employee_list_cache_invalidated_by_task_write(client, sample_task):
+    """Test a cached employee page is refreshed when an embedded task changes."""
+    response = client.get('/api/employees')
+    tasks = json.loads(response.data)['data'][0]['tasks']
+    assert tasks[0]['status'] == 'pending'
+    
+    client.put(f'/api/tasks/{sample_task.id}',
+               data=json.dumps({'status': 'completed'}),
+               content_type='application/json')
+    
+    response = client.get('/api/employees')
+    tasks = json.loads(response.data)['data'][0]['tasks']
+    assert tasks[0]['status'] == 'completed'
+
+
+def test_bulk_create_employees_validation_errors(client, init_database):
+    """Test per-item validation errors (keyed by index) are returned as JSON."""
+    employees = [
+        {'first_name': 'Good', 'last_name': 'User', 'email': 'good@test.com'},
+        {'first_name': 'Bad', 'last_name': 'User', 'email': 'bad-email'}
+    ]
+    response = client.post('/api/employees/bulk',
+                          data=json.dumps(employees),
+                          content_type='application/json')
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data['errors']['1']['email'] == ['Invalid email format']
+
+
+def test_update_employee_duplicate_email(client, sample_employee):
+    """Test updating employee to an email already in use fails."""
+    response = client.post('/api/employees',
+                          data=json.dumps({
+                              'first_name': 'Other',
+                              'last_name': 'User',
+                              'email': 'other@test.com'
+                          }),
+                          content_type='application/json')
+    other_id = json.loads(response.data)['data']['id']
+    
+    response = client.put(f'/api/employees/{other_id}',
+                         data=json.dumps({'email': sample_employee.email}),
+                         content_type='application/json')
+    assert response.status_code == 400
+    assert json.loads(response.data)['message'] == 'Email already exists'
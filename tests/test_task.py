@@ -2,6 +2,12 @@
 Test cases for Task API endpoints.
 """
 import json
+import os
+import subprocess
+import sys
+from sqlalchemy import event
+from app import db
+from app.models import Employee, Task
 
 
 def test_create_task(client, sample_employee):
@@ -32,6 +38,7 @@ def test_create_task_invalid_employee(client, init_database):
                           data=json.dumps(task_data),
                           content_type='application/json')
     assert response.status_code == 400
+    assert json.loads(response.data)['message'] == 'Employee with ID 99999 not found'
 
 
 def test_create_task_invalid_status(client, init_database):
@@ -111,3 +118,178 @@ def test_get_employee_tasks(client, sample_employee, sample_task):
     data = json.loads(response.data)
     assert len(data['data']) >= 1
     assert data['data'][0]['employee_id'] == sample_employee.id
+
+
+def test_get_all_tasks_includes_employee(client, sample_task):
+    """Test task list embeds the assigned employee without lazy loading per row."""
+    response = client.get('/api/tasks')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['data'][0]['employee']['id'] == sample_task.employee_id
+
+
+def test_update_task_invalid_priority(client, sample_task):
+    """Test updating task with invalid priority fails validation."""
+    response = client.put(f'/api/tasks/{sample_task.id}',
+                         data=json.dumps({'priority': 'critical'}),
+                         content_type='application/json')
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert 'priority' in data['errors']
+
+
+def test_get_task_etag_not_modified(client, sample_task):
+    """Test a matching If-None-Match returns 304 until the task changes."""
+    response = client.get(f'/api/tasks/{sample_task.id}')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+    
+    response = client.get(f'/api/tasks/{sample_task.id}',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    
+    client.put(f'/api/tasks/{sample_task.id}',
+               data=json.dumps({'status': 'completed'}),
+               content_type='application/json')
+    response = client.get(f'/api/tasks/{sample_task.id}',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_cursor_pagination(client, sample_employee):
+    """Test next_cursor walks the newest-first list without repeats."""
+    for i in range(3):
+        client.post('/api/tasks',
+                    data=json.dumps({'title': f'Cursor Task {i}'}),
+                    content_type='application/json')
+    
+    response = client.get('/api/tasks?per_page=2')
+    data = json.loads(response.data)
+    first_page = [task['id'] for task in data['data']]
+    cursor = data['pagination']['next_cursor']
+    assert cursor is not None
+    
+    response = client.get(f'/api/tasks?per_page=2&cursor={cursor}')
+    data = json.loads(response.data)
+    second_page = [task['id'] for task in data['data']]
+    assert data['pagination']['has_next'] is False
+    assert data['pagination']['next_cursor'] is None
+    assert sorted(first_page + second_page, reverse=True) == first_page + second_page
+    assert len(set(first_page + second_page)) == 3
+
+
+def test_invalid_cursor(client, init_database):
+    """Test a malformed cursor is rejected."""
+    response = client.get('/api/tasks?cursor=not-a-cursor')
+    assert response.status_code == 400
+
+
+def test_task_list_query_count(client, init_database):
+    """Test a full page of tasks with employees is loaded in a single SELECT."""
+    for i in range(10):
+        employee = Employee(first_name='Query', last_name=f'Count{i}', email=f'qc{i}@test.com')
+        db.session.add(employee)
+        db.session.flush()
+        db.session.add(Task(title=f'Query Task {i}', employee_id=employee.id))
+    db.session.commit()
+    
+    statements = []
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        # SAVEPOINTs come from the rollback fixture, not the endpoint
+        if not statement.startswith(('SAVEPOINT', 'RELEASE SAVEPOINT')):
+            statements.append(statement)
+    
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    try:
+        response = client.get('/api/tasks?per_page=10')
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statement)
+    
+    assert response.status_code == 200
+    assert len(json.loads(response.data)['data']) == 10
+    assert len(statements) == 1
+
+
+def test_bulk_create_tasks(client, sample_employee):
+    """Test creating several tasks in one request."""
+    tasks = [
+        {'title': f'Bulk Task {i}', 'employee_id': sample_employee.id}
+        for i in range(3)
+    ]
+    response = client.post('/api/tasks/bulk',
+                          data=json.dumps(tasks),
+                          content_type='application/json')
+    assert response.status_code == 201
+    assert json.loads(response.data)['count'] == 3
+    
+    response = client.get(f'/api/employees/{sample_employee.id}/tasks')
+    data = json.loads(response.data)
+    assert data['count'] == 3
+    assert all(task['status'] == 'pending' for task in data['data'])
+
+
+def test_bulk_create_tasks_invalid_employee(client, init_database):
+    """Test an unknown employee ID rejects the whole batch."""
+    tasks = [{'title': 'Orphan Task', 'employee_id': 99999}]
+    response = client.post('/api/tasks/bulk',
+                          data=json.dumps(tasks),
+                          content_type='application/json')
+    assert response.status_code == 400
+
+
+def test_get_employee_tasks_unknown_employee(client, init_database):
+    """Test listing tasks of a missing employee returns 404."""
+    response = client.get('/api/employees/99999/tasks')
+    assert response.status_code == 404
+
+
+def test_get_employee_tasks_empty(client, sample_employee):
+    """Test an employee without tasks returns an empty list."""
+    response = client.get(f'/api/employees/{sample_employee.id}/tasks')
+    assert response.status_code == 200
+    assert json.loads(response.data)['count'] == 0
+
+
+def test_task_list_etag_not_modified(client, sample_task):
+    """Test list responses carry an ETag and Cache-Control and honor If-None-Match."""
+    response = client.get('/api/tasks')
+    etag = response.headers['ETag']
+    assert 'max-age=' in response.headers['Cache-Control']
+    
+    response = client.get('/api/tasks', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    
+    client.delete(f'/api/tasks/{sample_task.id}')
+    response = client.get('/api/tasks', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def _first_request_status(path):
+    """Return the status of a GET sent as the first request of a new process."""
+    script = (
+        "from app import create_app\n"
+        "app = create_app('testing')\n"
+        f"print(app.test_client().get({path!r}).status_code)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return int(result.stdout.strip().splitlines()[-1])
+
+
+def test_get_task_first_request_in_new_process():
+    """Test task lookups work before any model instance has been loaded."""
+    # Missing task: 404 shows the query itself ran
+    assert _first_request_status('/api/tasks/1') == 404
+
+
+def test_list_tasks_first_request_in_new_process():
+    """Test the task list works before any model instance has been loaded."""
+    assert _first_request_status('/api/tasks') == 200
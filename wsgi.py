@@ -3,7 +3,7 @@ WSGI entry point for production deployment.
 Used by Gunicorn, uWSGI, or other WSGI servers.
 
 Usage:
-    gunicorn wsgi:app
+    gunicorn wsgi:app  (picks up gunicorn.conf.py: gevent workers)
 """
 import os
 from app import create_app